@@ -15,7 +15,7 @@ class CustomUserAdmin(UserAdmin):
         (None, {'fields': ('phone_number', 'password')}),
         ('Personal Info', {'fields': ('username', 'full_name')}),
         ('Permissions', {'fields': ('is_active', 'is_staff', 'is_superuser', 'groups', 'user_permissions')}),
-        ('Important dates', {'fields': ('last_login', 'date_joined')}),
+        ('Important dates', {'fields': ('last_login', 'date_joined', 'login_count')}),
     )
     
     add_fieldsets = (
@@ -25,4 +25,4 @@ class CustomUserAdmin(UserAdmin):
         }),
     )
     
-    readonly_fields = ('date_joined',)
+    readonly_fields = ('date_joined', 'login_count')
@@ -0,0 +1,65 @@
+from django.contrib.auth import get_user_model
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from .cache import get_cached_user
+from .tokens import USER_CLAIMS
+
+
+class ClaimsJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication without a user query per request.
+
+    Read-only requests (GET/HEAD/OPTIONS) get a stateless `TokenUser` built
+    from the signed `is_active` / `is_staff` claims, so a deactivated user
+    keeps read access until the access token expires. Other requests, and
+    tokens issued without the claims, are checked against the user's
+    `is_active`, `is_staff` and password digest from a short-lived cache
+    that is dropped when the user is saved; other requests then get the
+    user instance for the view.
+    """
+
+    def authenticate(self, request):
+        self.read_only = request.method in SAFE_METHODS
+        return super().authenticate(request)
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken(
+                _("Token contained no recognizable user identification")
+            ) from e
+
+        if self.read_only and all(claim in validated_token for claim in USER_CLAIMS):
+            if api_settings.CHECK_USER_IS_ACTIVE and not validated_token["is_active"]:
+                raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+            return api_settings.TOKEN_USER_CLASS(validated_token)
+
+        user = get_cached_user(user_id)
+        if user is None:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not user["is_active"]:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) != user["password_digest"]:
+                raise AuthenticationFailed(
+                    _("The user's password has been changed."), code="password_changed"
+                )
+
+        if self.read_only:
+            # Tokens issued without the claims get them from the cached row
+            for claim in USER_CLAIMS:
+                validated_token[claim] = user[claim]
+            return api_settings.TOKEN_USER_CLASS(validated_token)
+
+        model_user = get_user_model().objects.filter(pk=user["pk"]).first()
+        if model_user is None:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+        return model_user
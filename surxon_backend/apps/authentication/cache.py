@@ -0,0 +1,39 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+# Short, because only saves through the ORM invalidate the cached row
+USER_CACHE_TIMEOUT = 60
+
+
+def _user_key(user_id):
+    return f"auth-user:{user_id}"
+
+
+def get_cached_user(user_id):
+    """
+    Return ``{"pk", "is_active", "is_staff", "password_digest"}`` for a
+    token's user id from the cache, loading it on a miss. Returns None if
+    there is no such user.
+
+    Only what authentication checks is cached; `password_digest` is the
+    value tokens carry in the revoke claim, not the password hash itself.
+    """
+    key = _user_key(user_id)
+    user = cache.get(key)
+    if user is None:
+        User = get_user_model()
+        user = (
+            User.objects.filter(**{api_settings.USER_ID_FIELD: user_id})
+            .values("pk", "is_active", "is_staff", "password")
+            .first()
+        )
+        if user is not None:
+            user["password_digest"] = get_md5_hash_password(user.pop("password"))
+            cache.set(key, user, USER_CACHE_TIMEOUT)
+    return user
+
+
+def invalidate_cached_user(user_id):
+    cache.delete(_user_key(user_id))
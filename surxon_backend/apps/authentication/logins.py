@@ -0,0 +1,108 @@
+import atexit
+import logging
+import os
+import threading
+
+from django.contrib.auth import get_user_model
+from django.db import connections, router
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+# Pending logins are written at least this often (seconds) ...
+FLUSH_INTERVAL = 5
+# ... or as soon as this many users have logged in since the last write
+FLUSH_THRESHOLD = 500
+# Rows per UPDATE statement
+FLUSH_BATCH_SIZE = 1000
+
+
+class LoginRecorder:
+    """
+    Buffers login bookkeeping (`last_login`, `login_count`) in process memory
+    and writes it in batches, instead of an UPDATE of the user row per login.
+
+    Each flush is one ``UPDATE ... FROM (VALUES ...)`` per `FLUSH_BATCH_SIZE`
+    users, run from a background timer, when `FLUSH_THRESHOLD` users are
+    pending, and at interpreter exit. Logins buffered by a worker that is
+    killed without a clean shutdown are lost; both fields are informational.
+    """
+
+    def __init__(self, interval=FLUSH_INTERVAL, threshold=FLUSH_THRESHOLD):
+        self.interval = interval
+        self.threshold = threshold
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._timer = None
+        self._pid = os.getpid()
+        atexit.register(self.flush)
+
+    def record(self, user, when=None):
+        when = when or timezone.now()
+        user.last_login = when
+        with self._lock:
+            if self._pid != os.getpid():
+                # Forked worker: the parent's buffer and timer are not ours
+                self._pending.clear()
+                self._timer = None
+                self._pid = os.getpid()
+
+            last_login, count = self._pending.get(user.pk, (when, 0))
+            self._pending[user.pk] = (max(last_login, when), count + 1)
+            full = len(self._pending) >= self.threshold
+            if not full and self._timer is None:
+                self._timer = threading.Timer(self.interval, self._flush_in_thread)
+                self._timer.daemon = True
+                self._timer.start()
+        if full:
+            self.flush()
+
+    def flush(self):
+        """Write all pending logins. Returns the number of users updated."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        if not pending:
+            return 0
+
+        User = get_user_model()
+        rows = [(pk, last_login, count) for pk, (last_login, count) in pending.items()]
+        try:
+            with connections[router.db_for_write(User)].cursor() as cursor:
+                for start in range(0, len(rows), FLUSH_BATCH_SIZE):
+                    self._write(cursor, cursor.db.ops.quote_name(User._meta.db_table), rows[start:start + FLUSH_BATCH_SIZE])
+        except Exception:
+            logger.exception("Failed to write %d buffered logins", len(rows))
+            return 0
+        return len(rows)
+
+    @staticmethod
+    def _write(cursor, table, rows):
+        values = ", ".join(["(%s, %s::timestamptz, %s::integer)"] * len(rows))
+        cursor.execute(
+            f"""
+            UPDATE {table} AS u
+            SET last_login = GREATEST(u.last_login, v.last_login),
+                login_count = u.login_count + v.logins
+            FROM (VALUES {values}) AS v(id, last_login, logins)
+            WHERE u.id = v.id
+            """,
+            [value for row in rows for value in row],
+        )
+
+    def _flush_in_thread(self):
+        try:
+            self.flush()
+        finally:
+            # Timer threads are short-lived, don't leak their connection
+            connections.close_all()
+
+
+recorder = LoginRecorder()
+
+
+def record_login(user):
+    """Buffer a successful login of ``user``."""
+    recorder.record(user)
@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+
+from apps.authentication.revocation import prune_expired_tokens
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete expired refresh tokens and their blacklist entries in small "
+        "batches. Safe to run while the API is serving traffic."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size", type=int, default=5000,
+            help="Tokens deleted per statement (default: 5000)",
+        )
+        parser.add_argument(
+            "--pause", type=float, default=0.0,
+            help="Seconds to sleep between batches (default: 0)",
+        )
+
+    def handle(self, *args, **options):
+        total = 0
+        for deleted in prune_expired_tokens(options["batch_size"], options["pause"]):
+            total += deleted
+            self.stdout.write(f"Deleted {deleted} tokens ({total} total)")
+        self.stdout.write(self.style.SUCCESS(f"Pruned {total} expired tokens"))
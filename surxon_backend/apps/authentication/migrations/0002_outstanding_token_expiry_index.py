@@ -0,0 +1,25 @@
+# Generated by Django 5.2.9 on 2026-10-18 14:10
+
+from django.db import migrations
+
+# Lets `prune_tokens` and the revocation filter find (un)expired tokens
+# without scanning token_blacklist_outstandingtoken, which we do not own
+CREATE_INDEX_SQL = """
+CREATE INDEX IF NOT EXISTS token_outstanding_expires_at_idx
+ON token_blacklist_outstandingtoken (expires_at)
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("authentication", "0001_initial"),
+        ("token_blacklist", "0013_alter_blacklistedtoken_options_and_more"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            CREATE_INDEX_SQL,
+            "DROP INDEX IF EXISTS token_outstanding_expires_at_idx",
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.9 on 2026-10-18 12:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("authentication", "0002_outstanding_token_expiry_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="customuser",
+            name="login_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+    ]
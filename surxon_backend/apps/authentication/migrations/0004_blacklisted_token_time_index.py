@@ -0,0 +1,25 @@
+# Generated by Django 5.2.9 on 2026-10-18 15:02
+
+from django.db import migrations
+
+# Lets the revocation filter re-read recently blacklisted tokens without
+# scanning token_blacklist_blacklistedtoken, which we do not own
+CREATE_INDEX_SQL = """
+CREATE INDEX IF NOT EXISTS token_blacklisted_at_idx
+ON token_blacklist_blacklistedtoken (blacklisted_at)
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("authentication", "0003_login_count"),
+        ("token_blacklist", "0013_alter_blacklistedtoken_options_and_more"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            CREATE_INDEX_SQL,
+            "DROP INDEX IF EXISTS token_blacklisted_at_idx",
+        ),
+    ]
@@ -59,6 +59,8 @@ class CustomUser(AbstractBaseUser, PermissionsMixin):
     is_active = models.BooleanField(default=True)
     is_staff = models.BooleanField(default=False)
     date_joined = models.DateTimeField(auto_now_add=True)
+    # Updated in batches by apps.authentication.logins, not on each login
+    login_count = models.PositiveIntegerField(default=0, editable=False)
     
     objects = CustomUserManager()
     
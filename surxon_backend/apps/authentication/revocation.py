@@ -0,0 +1,151 @@
+import hashlib
+import math
+import threading
+import time
+from datetime import timedelta
+
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+
+from utils.cache import bump_cache_version, get_cache_version
+
+TOKEN_REVOCATIONS = "token-revocations"
+
+
+class BloomFilter:
+    """
+    Fixed-size set of strings with no false negatives and a bounded false
+    positive rate at ``capacity`` items.
+    """
+
+    def __init__(self, capacity, error_rate=0.001):
+        self.capacity = capacity
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, value):
+        digest = hashlib.blake2b(value.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return ((first + i * second) % self.size for i in range(self.hashes))
+
+    def add(self, value):
+        for position in self._positions(value):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, value):
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(value))
+
+
+class RevocationList:
+    """
+    Per-process Bloom filter of blacklisted refresh token `jti`s.
+
+    A `jti` that is not in the filter is definitely not blacklisted, so the
+    common refresh costs one cache read and no query; only filter hits are
+    confirmed against `BlacklistedToken`. The filter is topped up with the
+    rows blacklisted since the last sync when the shared `token-revocations`
+    version has changed, at most every `min_interval`
+    seconds, and at least every `max_age` seconds. Every rotation bumps the
+    version, so under steady refresh traffic each process runs one
+    catch-up query per `min_interval` rather than one per refresh; a token
+    revoked by another process is seen within that interval. Rows commit
+    out of insertion order, so each catch-up re-reads the last
+    `commit_margin` seconds before the previous sync as well. The filter is
+    rebuilt from the unexpired rows when it fills up or after
+    `rebuild_interval`, which drops tokens removed by `prune_tokens` (run
+    periodically by `docker/entrypoint.sh`).
+
+    With a per-process cache backend (LocMem) other workers only see a new
+    revocation after `max_age`; production should use a shared cache.
+    """
+
+    def __init__(
+        self, capacity=100_000, max_age=60, min_interval=2, commit_margin=30,
+        rebuild_interval=60 * 60 * 24,
+    ):
+        self.capacity = capacity
+        self.max_age = max_age
+        self.min_interval = min_interval
+        self.commit_margin = commit_margin
+        self.rebuild_interval = rebuild_interval
+        self._lock = threading.Lock()
+        self._filter = None
+        # Wall-clock start of the last sync's query
+        self._loaded_at = None
+        self._version = None
+        self._synced_at = 0.0
+        self._built_at = 0.0
+
+    def is_revoked(self, jti):
+        if jti not in self._sync():
+            return False
+        return BlacklistedToken.objects.filter(token__jti=jti).exists()
+
+    def add(self, jti):
+        """Record a revocation made by this process and tell the others."""
+        with self._lock:
+            if self._filter is not None:
+                self._filter.add(jti)
+        bump_cache_version(TOKEN_REVOCATIONS)
+
+    def _sync(self):
+        version = get_cache_version(TOKEN_REVOCATIONS)
+        now = time.monotonic()
+        with self._lock:
+            if (
+                self._filter is None
+                or self._filter.count > self._filter.capacity
+                or now - self._built_at > self.rebuild_interval
+            ):
+                self._rebuild(now)
+            elif (
+                version != self._version and now - self._synced_at >= self.min_interval
+                or now - self._synced_at > self.max_age
+            ):
+                started = timezone.now()
+                since = self._loaded_at - timedelta(seconds=self.commit_margin)
+                self._load(BlacklistedToken.objects.filter(blacklisted_at__gte=since))
+                self._loaded_at = started
+            else:
+                return self._filter
+            self._version = version
+            self._synced_at = now
+            return self._filter
+
+    def _rebuild(self, now):
+        started = timezone.now()
+        rows = BlacklistedToken.objects.filter(token__expires_at__gt=started)
+        self._filter = BloomFilter(max(self.capacity, rows.count() * 2))
+        self._built_at = now
+        self._load(rows)
+        self._loaded_at = started
+
+    def _load(self, rows):
+        for jti in rows.values_list("token__jti", flat=True).iterator(chunk_size=10_000):
+            # Overlapping catch-ups see rows again; don't count them twice
+            if jti not in self._filter:
+                self._filter.add(jti)
+
+
+revocations = RevocationList()
+
+
+def prune_expired_tokens(batch_size=5000, pause=0.0):
+    """
+    Delete expired outstanding tokens (and, by cascade, their blacklist
+    rows) in batches of ``batch_size`` so no single statement locks much of
+    the table. Yields the number of tokens deleted per batch.
+    """
+    expired = OutstandingToken.objects.filter(expires_at__lte=timezone.now()).order_by("id")
+    while True:
+        ids = list(expired.values_list("id", flat=True)[:batch_size])
+        if not ids:
+            return
+        deleted = OutstandingToken.objects.filter(id__in=ids).delete()[1].get(OutstandingToken._meta.label, 0)
+        yield deleted
+        if pause:
+            time.sleep(pause)
@@ -2,6 +2,9 @@ from rest_framework import serializers
 from django.contrib.auth import authenticate
 from django.contrib.auth.password_validation import validate_password
 from django.contrib.auth import get_user_model
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer
+
+from .tokens import UserClaimsRefreshToken
 
 User = get_user_model()
 
@@ -57,3 +60,8 @@ class UserSerializer(serializers.ModelSerializer):
         model = User
         fields = ('id', 'username', 'full_name', 'phone_number', 'date_joined')
         read_only_fields = ('id', 'date_joined')
+
+
+class ClaimsTokenRefreshSerializer(TokenRefreshSerializer):
+    """Issues access tokens carrying the user claims (see `tokens.py`)."""
+    token_class = UserClaimsRefreshToken
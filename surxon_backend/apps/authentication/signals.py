@@ -0,0 +1,37 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import update_last_login
+from django.contrib.auth.signals import user_logged_in
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+
+from .cache import invalidate_cached_user
+from .logins import record_login
+from .revocation import revocations
+
+
+@receiver([post_save, post_delete], sender=get_user_model())
+def user_changed(sender, instance, **kwargs):
+    """Drop the cached user values used by `ClaimsJWTAuthentication`."""
+    # After commit, or a concurrent request could cache the old row again
+    user_id = instance.pk
+    transaction.on_commit(lambda: invalidate_cached_user(user_id))
+
+
+@receiver(post_save, sender=BlacklistedToken)
+def token_blacklisted(sender, instance, created, **kwargs):
+    """Add the revoked `jti` to the revocation filter of every process."""
+    if created:
+        jti = instance.token.jti
+        transaction.on_commit(lambda: revocations.add(jti))
+
+
+# Session logins (admin) go through the buffered recorder as well
+user_logged_in.disconnect(update_last_login, dispatch_uid="update_last_login")
+
+
+@receiver(user_logged_in)
+def user_logged_in_recorded(sender, request, user, **kwargs):
+    """Replaces Django's per-login `update_last_login` write."""
+    record_login(user)
@@ -0,0 +1,44 @@
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from .cache import get_cached_user
+from .revocation import revocations
+
+# User fields signed into tokens so read-only requests need no user lookup
+USER_CLAIMS = ("is_active", "is_staff")
+
+
+def set_user_claims(token, user):
+    for claim in USER_CLAIMS:
+        token[claim] = getattr(user, claim)
+
+
+class UserClaimsRefreshToken(RefreshToken):
+    """
+    Refresh token whose access tokens carry the `USER_CLAIMS` of the user.
+
+    Claims are taken from the cached user values each time an access token is
+    issued, so a refresh picks up changes to the user. Blacklist checks go
+    through the in-memory `revocations` filter instead of a query per refresh.
+    """
+
+    def check_blacklist(self):
+        if revocations.is_revoked(self.payload[api_settings.JTI_CLAIM]):
+            raise TokenError(_("Token is blacklisted"))
+
+    @classmethod
+    def for_user(cls, user):
+        token = super().for_user(user)
+        set_user_claims(token, user)
+        return token
+
+    @property
+    def access_token(self):
+        access = super().access_token
+        user = get_cached_user(self.payload.get(api_settings.USER_ID_CLAIM))
+        if user is not None:
+            for claim in USER_CLAIMS:
+                access[claim] = user[claim]
+        return access
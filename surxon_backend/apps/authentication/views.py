@@ -2,14 +2,15 @@ from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated, AllowAny
-from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.views import TokenRefreshView
 from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
 from django.contrib.auth import logout
-from drf_yasg.utils import swagger_auto_schema
-from drf_yasg import openapi
+
+from utils.openapi import openapi, swagger_auto_schema
 
 from .serializers import UserRegistrationSerializer, UserLoginSerializer, UserSerializer
+from .logins import record_login
+from .tokens import UserClaimsRefreshToken
 
 
 class RegisterView(APIView):
@@ -25,7 +26,7 @@ class RegisterView(APIView):
             user = serializer.save()
             
             # Generate tokens for the new user
-            refresh = RefreshToken.for_user(user)
+            refresh = UserClaimsRefreshToken.for_user(user)
             access_token = refresh.access_token
             
             return Response({
@@ -54,8 +55,10 @@ class LoginView(APIView):
             if not user:
                 return Response({'error': 'User data is missing'}, status=status.HTTP_400_BAD_REQUEST)
             
+            record_login(user)
+            
             # Generate tokens
-            refresh = RefreshToken.for_user(user)
+            refresh = UserClaimsRefreshToken.for_user(user)
             access_token = refresh.access_token
             
             return Response({
@@ -83,7 +86,7 @@ class LogoutView(APIView):
         try:
             refresh_token = request.data.get('refresh')
             if refresh_token:
-                token = RefreshToken(refresh_token)
+                token = UserClaimsRefreshToken(refresh_token)
                 token.blacklist()
             
             # Django session logout
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class BrandsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.brands"
+
+    def ready(self):
+        from . import signals
@@ -0,0 +1,40 @@
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from django.db.models import Count, Max, Min
+
+from apps.products.cache import CATALOG, PRODUCTS
+from utils.cache import get_cache_versions
+from utils.conditional import make_etag
+
+from .models import Brand
+from .serializers import BrandListSerializer
+
+BRAND_LIST = "brand-list"
+# Safety net only; the list is invalidated through the catalog generations
+BRAND_LIST_TIMEOUT = 60 * 60 * 24
+
+
+def get_brand_list(request):
+    """
+    Return ``{"data": [...], "etag": '"..."'}`` for all brands with their
+    product counts and price ranges, computed by one aggregate query per
+    catalog version and served from the cache.
+    """
+    versions = get_cache_versions([CATALOG, PRODUCTS])
+    # Logo URLs are absolute, so entries are per scheme and host
+    key = (
+        f"{BRAND_LIST}:{request.scheme}:{request.get_host()}:"
+        f"{versions[CATALOG]}:{versions[PRODUCTS]}"
+    )
+    brands = cache.get(key)
+    if brands is None:
+        # Read the primary, see `_category_tree_queryset()`
+        queryset = Brand.objects.using(DEFAULT_DB_ALIAS).annotate(
+            product_count=Count("products"),
+            min_price=Min("products__final_price"),
+            max_price=Max("products__final_price"),
+        ).order_by("name")
+        data = list(BrandListSerializer(queryset, many=True, context={"request": request}).data)
+        brands = {"data": data, "etag": make_etag(data)}
+        cache.set(key, brands, BRAND_LIST_TIMEOUT)
+    return brands
@@ -0,0 +1,72 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from django.core.management.base import BaseCommand, CommandError
+from PIL import UnidentifiedImageError
+
+from apps.brands.models import Brand
+from apps.brands.renditions import render_logo, store_renditions
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate the WebP/JPEG renditions of brand logos that do not have "
+        "them yet, rendering in parallel worker processes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers", type=int, default=os.cpu_count() or 1,
+            help="Worker processes (default: number of CPUs)",
+        )
+        parser.add_argument(
+            "--force", action="store_true",
+            help="Regenerate renditions for every logo",
+        )
+
+    def handle(self, *args, **options):
+        workers = options["workers"]
+        if workers < 1:
+            raise CommandError("--workers must be positive.")
+
+        brands = [
+            brand for brand in Brand.objects.exclude(logo="").exclude(logo__isnull=True)
+            if options["force"] or brand.logo_renditions.get("source") != brand.logo.name
+        ]
+        if not brands:
+            self.stdout.write("All logos already have renditions.")
+            return
+
+        started = time.monotonic()
+        done = failed = 0
+        # Workers only turn bytes into bytes; storage and database access
+        # stay in this process
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {}
+            for brand in brands:
+                try:
+                    with brand.logo.open("rb") as logo:
+                        data = logo.read()
+                except OSError as exc:
+                    failed += 1
+                    self.stderr.write(f"{brand.name}: cannot read {brand.logo.name}: {exc}")
+                    continue
+                futures[executor.submit(render_logo, data)] = (brand, data)
+
+            for future in as_completed(futures):
+                brand, data = futures[future]
+                try:
+                    renditions = store_renditions(brand.logo.name, data, future.result())
+                except (OSError, UnidentifiedImageError, ValueError) as exc:
+                    failed += 1
+                    self.stderr.write(f"{brand.name}: {exc}")
+                    continue
+                Brand.objects.filter(pk=brand.pk).update(logo_renditions=renditions)
+                done += 1
+
+        elapsed = time.monotonic() - started
+        self.stdout.write(self.style.SUCCESS(
+            f"Generated renditions for {done} logos in {elapsed:.1f}s "
+            f"with {workers} workers, {failed} failed."
+        ))
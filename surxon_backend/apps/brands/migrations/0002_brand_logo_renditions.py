@@ -0,0 +1,18 @@
+# Generated by Django 5.2.9 on 2026-10-18 12:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("brands", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="brand",
+            name="logo_renditions",
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+    ]
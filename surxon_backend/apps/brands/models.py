@@ -14,6 +14,8 @@ class Brand(AbstractBaseModel):
         null=True,
         validators=[FileExtensionValidator(allowed_extensions=["jpg", "jpeg", "png"])],
     )
+    # Resized copies of the logo, see `apps.brands.renditions`
+    logo_renditions = models.JSONField(default=dict, blank=True, editable=False)
 
     class Meta:
         verbose_name = "Brand"
@@ -0,0 +1,91 @@
+import hashlib
+import io
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from PIL import Image, ImageOps
+
+# Square boxes the logo is fitted into, in pixels
+RENDITION_SIZES = (64, 128, 256)
+RENDITION_FORMATS = {
+    # WebP keeps transparency; JPEG is the fallback for older clients
+    "webp": {"format": "WEBP", "quality": 80, "method": 6},
+    "jpeg": {"format": "JPEG", "quality": 85, "optimize": True, "progressive": True},
+}
+RENDITION_DIR = "brands/logos/renditions"
+
+
+def render_logo(data):
+    """
+    Render every size and format of a logo from its raw bytes.
+
+    Returns ``{(size, format): bytes}``. Works on bytes only, so it can run
+    in a worker process.
+    """
+    with Image.open(io.BytesIO(data)) as image:
+        image = ImageOps.exif_transpose(image).convert("RGBA")
+
+    rendered = {}
+    for size in RENDITION_SIZES:
+        logo = ImageOps.contain(image, (size, size), Image.Resampling.LANCZOS)
+        canvas = Image.new("RGBA", (size, size), (255, 255, 255, 0))
+        canvas.paste(logo, ((size - logo.width) // 2, (size - logo.height) // 2), logo)
+
+        for fmt, options in RENDITION_FORMATS.items():
+            if fmt == "jpeg":
+                # No alpha channel in JPEG: flatten onto white
+                frame = Image.new("RGB", canvas.size, (255, 255, 255))
+                frame.paste(canvas, mask=canvas.getchannel("A"))
+            else:
+                frame = canvas
+            buffer = io.BytesIO()
+            frame.save(buffer, **options)
+            rendered[(size, fmt)] = buffer.getvalue()
+    return rendered
+
+
+def rendition_name(digest, size, fmt):
+    return f"{RENDITION_DIR}/{digest[:20]}-{size}.{fmt}"
+
+
+def store_renditions(source_name, data, rendered=None, storage=default_storage):
+    """
+    Save the renditions of a logo under content-hashed names and return the
+    value for `Brand.logo_renditions`.
+
+    Names depend only on the source bytes, so unchanged logos reuse the
+    files already in storage.
+    """
+    digest = hashlib.sha256(data).hexdigest()
+    files = {}
+    for size in RENDITION_SIZES:
+        for fmt in RENDITION_FORMATS:
+            name = rendition_name(digest, size, fmt)
+            if not storage.exists(name):
+                if rendered is None:
+                    rendered = render_logo(data)
+                name = storage.save(name, ContentFile(rendered[(size, fmt)]))
+            files.setdefault(str(size), {})[fmt] = name
+    return {"source": source_name, "files": files}
+
+
+def generate_renditions(brand):
+    """
+    Build and store the renditions of ``brand.logo`` and save them on the
+    brand. Brands without a logo get their renditions cleared.
+    """
+    renditions = {}
+    if brand.logo:
+        with brand.logo.open("rb") as logo:
+            renditions = store_renditions(brand.logo.name, logo.read())
+    type(brand).objects.filter(pk=brand.pk).update(logo_renditions=renditions)
+    brand.logo_renditions = renditions
+    return renditions
+
+
+def rendition_urls(renditions, storage=default_storage):
+    """Map ``{"64": {"webp": name}}`` to ``{"64": {"webp": url}}``."""
+    return {
+        size: {fmt: storage.url(name) for fmt, name in formats.items()}
+        for size, formats in (renditions or {}).get("files", {}).items()
+    }
@@ -0,0 +1,39 @@
+from rest_framework import serializers
+
+from .models import Brand
+from .renditions import rendition_urls
+
+
+class BrandSerializer(serializers.ModelSerializer):
+    """
+    Brand with its logo and the logo renditions as
+    ``{"64": {"webp": url, "jpeg": url}, ...}``.
+    """
+    logo_renditions = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Brand
+        fields = ("id", "name", "logo", "logo_renditions")
+
+    def get_logo_renditions(self, obj):
+        urls = rendition_urls(obj.logo_renditions)
+        request = self.context.get("request")
+        if request is not None:
+            urls = {
+                size: {fmt: request.build_absolute_uri(url) for fmt, url in formats.items()}
+                for size, formats in urls.items()
+            }
+        return urls
+
+
+class BrandListSerializer(BrandSerializer):
+    """
+    Brand with its product count and the range of prices after discount,
+    read from `product_count`, `min_price` and `max_price` annotations.
+    """
+    product_count = serializers.IntegerField(read_only=True)
+    min_price = serializers.DecimalField(max_digits=14, decimal_places=2, read_only=True)
+    max_price = serializers.DecimalField(max_digits=14, decimal_places=2, read_only=True)
+
+    class Meta(BrandSerializer.Meta):
+        fields = BrandSerializer.Meta.fields + ("product_count", "min_price", "max_price")
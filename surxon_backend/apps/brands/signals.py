@@ -0,0 +1,13 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from .models import Brand
+from .renditions import generate_renditions
+
+
+@receiver(post_save, sender=Brand)
+def brand_logo_changed(sender, instance, raw=False, **kwargs):
+    """Render the logo renditions when a new logo is uploaded."""
+    source = (instance.logo_renditions or {}).get("source")
+    if not raw and (instance.logo.name or None) != source:
+        generate_renditions(instance)
@@ -0,0 +1,8 @@
+from django.urls import path
+
+from .views import brand_list_view, brand_product_list_view
+
+urlpatterns = [
+    path("", brand_list_view, name="brand-list"),
+    path("<uuid:brand_id>/products/", brand_product_list_view, name="brand-product-list"),
+]
@@ -1,2 +1,75 @@
+from django.http import Http404
+from rest_framework import generics, permissions
 
-# Create your views here.
+from apps.products.cache import CATALOG, PRODUCTS
+from apps.products.models import Product
+from apps.products.serializers import ProductListValuesSerializer
+from apps.products.views import CatalogListMixin
+from utils.conditional import not_modified_response
+from utils.pagination import CatalogPagination
+from utils.response_format import APIResponse
+
+from .cache import get_brand_list
+from .models import Brand
+from .serializers import BrandListSerializer
+
+
+class BrandListAPIView(generics.ListAPIView):
+    """
+    Returns all brands with their logo renditions, product count and price
+    range (after discount).
+
+    The list is computed with one annotated query, cached until a product,
+    category or brand changes, and carries a strong ETag for
+    `If-None-Match`.
+
+    URL: GET /api/brands/
+    """
+    permission_classes = [permissions.AllowAny]
+    serializer_class = BrandListSerializer
+
+    def list(self, request, *args, **kwargs):
+        brands = get_brand_list(request)
+        not_modified = not_modified_response(request, etag=brands["etag"])
+        if not_modified is not None:
+            return not_modified
+
+        response = APIResponse.success(
+            data=brands["data"],
+            message="Brands retrieved successfully"
+        )
+        response["ETag"] = brands["etag"]
+        return response
+
+
+class BrandProductListAPIView(CatalogListMixin, generics.ListAPIView):
+    """
+    Returns paginated products of a brand. Supports the same filters,
+    facets, sorting, pagination modes and sparse fieldsets as the product
+    list.
+
+    URL: GET /api/brands/<uuid:brand_id>/products/
+    """
+    permission_classes = [permissions.AllowAny]
+    serializer_class = ProductListValuesSerializer
+    pagination_class = CatalogPagination
+
+    def get_cache_generations(self):
+        return [CATALOG, PRODUCTS]
+
+    def get_queryset(self):
+        return ProductListValuesSerializer.setup_queryset(
+            Product.objects.filter(brand_id=self.kwargs["brand_id"]).order_by("-created_at"),
+            self.request,
+        )
+
+    def paginate_queryset(self, queryset):
+        page = super().paginate_queryset(queryset)
+        if not page and not Brand.objects.filter(pk=self.kwargs["brand_id"]).exists():
+            raise Http404
+        return page
+
+
+# View instances for URL patterns
+brand_list_view = BrandListAPIView.as_view()
+brand_product_list_view = BrandProductListAPIView.as_view()
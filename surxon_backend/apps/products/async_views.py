@@ -0,0 +1,136 @@
+"""
+Async counterparts of the read-only catalog views in `views.py`, routed
+instead of them when `ASYNC_CATALOG_VIEWS` is on (the ASGI serve mode).
+
+Responses are identical; queries go through the async ORM so a worker can
+overlap many slow clients. Facet counts run a raw SQL query and stay
+synchronous (in a thread).
+"""
+from asgiref.sync import sync_to_async
+from django.http import Http404
+from rest_framework import permissions
+
+from .cache import aget_category_tree
+from .filters import ProductFacetFilter
+from .models.categories import Category
+from .models.products import Product
+from .serializers import ProductDetailSerializer
+from .views import (
+    CatalogListMixin, FacetedListMixin, ProductDetailAPIView, ProductListAPIView,
+    ProductListByCategoryAPIView
+)
+from utils.async_views import AsyncAPIView, AsyncListAPIView, AsyncRetrieveAPIView
+from utils.cache import AsyncCachedResponseMixin
+from utils.conditional import (
+    AsyncConditionalListMixin, AsyncConditionalRetrieveMixin, not_modified_response
+)
+from utils.response_format import APIResponse
+
+
+class AsyncCategoryListAPIView(AsyncAPIView):
+    """
+    Async `CategoryListAPIView`.
+
+    URL: GET /api/products/categories/
+    """
+    permission_classes = [permissions.AllowAny]
+
+    async def get(self, request, *args, **kwargs):
+        tree = await aget_category_tree()
+        not_modified = not_modified_response(request, etag=tree["etag"])
+        if not_modified is not None:
+            return not_modified
+
+        response = APIResponse.success(
+            data=tree["data"],
+            message="Categories retrieved successfully"
+        )
+        response["ETag"] = tree["etag"]
+        return response
+
+
+class AsyncFacetedListMixin(FacetedListMixin):
+    async def alist(self, request, *args, **kwargs):
+        response = await super().alist(request, *args, **kwargs)
+        if ProductFacetFilter.facets_requested(request):
+            get_facets = sync_to_async(ProductFacetFilter().get_facets)
+            response.data["facets"] = await get_facets(request, self.get_queryset())
+        return response
+
+
+class AsyncCatalogListMixin(AsyncCachedResponseMixin, AsyncFacetedListMixin, AsyncConditionalListMixin):
+    conditional_fields = CatalogListMixin.conditional_fields
+    conditional_headers = CatalogListMixin.conditional_headers
+    cache_vary_headers = CatalogListMixin.cache_vary_headers
+    fingerprint_ignored_params = CatalogListMixin.fingerprint_ignored_params
+
+    get_conditional_generations = CatalogListMixin.get_conditional_generations
+
+
+class AsyncProductListAPIView(AsyncCatalogListMixin, AsyncListAPIView):
+    """
+    Async `ProductListAPIView`.
+
+    URL: GET /api/products/
+    """
+    permission_classes = ProductListAPIView.permission_classes
+    serializer_class = ProductListAPIView.serializer_class
+    pagination_class = ProductListAPIView.pagination_class
+
+    get_cache_generations = ProductListAPIView.get_cache_generations
+    get_queryset = ProductListAPIView.get_queryset
+
+
+class AsyncProductDetailAPIView(AsyncCachedResponseMixin, AsyncConditionalRetrieveMixin, AsyncRetrieveAPIView):
+    """
+    Async `ProductDetailAPIView`.
+
+    URL: GET /api/products/<uuid:product_id>/
+    """
+    permission_classes = ProductDetailAPIView.permission_classes
+    serializer_class = ProductDetailAPIView.serializer_class
+    lookup_field = ProductDetailAPIView.lookup_field
+    lookup_url_kwarg = ProductDetailAPIView.lookup_url_kwarg
+    conditional_fields = ProductDetailAPIView.conditional_fields
+
+    get_cache_generations = ProductDetailAPIView.get_cache_generations
+
+    def get_queryset(self):
+        return ProductDetailSerializer.setup_queryset(
+            Product.objects.select_related("category"), self.request
+        )
+
+    async def aretrieve(self, request, *args, **kwargs):
+        instance = await self.aget_object()
+        serializer = self.get_serializer(instance)
+        return APIResponse.success(
+            data=serializer.data,
+            message="Product details retrieved successfully"
+        )
+
+
+class AsyncProductListByCategoryAPIView(AsyncCatalogListMixin, AsyncListAPIView):
+    """
+    Async `ProductListByCategoryAPIView`.
+
+    URL: GET /api/products/categories/<uuid:category_id>/
+    """
+    permission_classes = ProductListByCategoryAPIView.permission_classes
+    serializer_class = ProductListByCategoryAPIView.serializer_class
+    pagination_class = ProductListByCategoryAPIView.pagination_class
+
+    get_cache_generations = ProductListByCategoryAPIView.get_cache_generations
+    get_queryset = ProductListByCategoryAPIView.get_queryset
+
+    async def apaginate_queryset(self, queryset):
+        page = await super().apaginate_queryset(queryset)
+        if not page and not await Category.objects.filter(pk=self.kwargs.get("category_id")).aexists():
+            raise Http404
+        return page
+
+
+# View instances for URL patterns
+category_list_view = AsyncCategoryListAPIView.as_view()
+product_list_view = AsyncProductListAPIView.as_view()
+product_detail_view = AsyncProductDetailAPIView.as_view()
+product_list_by_category_view = AsyncProductListByCategoryAPIView.as_view()
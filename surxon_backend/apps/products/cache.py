@@ -0,0 +1,89 @@
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+
+from utils.cache import (
+    aget_cache_version, bump_cache_version, bump_cache_versions, get_cache_version
+)
+from utils.conditional import make_etag
+
+from .models.categories import Category
+from .serializers import CategorySerializer
+
+CATEGORY_TREE = "category-tree"
+# Safety net only; the tree is invalidated by Category save/delete signals
+CATEGORY_TREE_TIMEOUT = 60 * 60 * 24
+
+# Response cache generations (see `CachedResponseMixin`):
+# bumped by category and brand changes, which can show up in any response
+CATALOG = "catalog"
+# bumped by any product change
+PRODUCTS = "products"
+
+
+def category_generation(category_id):
+    """Bumped by changes to products in the category or its children."""
+    return f"category:{category_id}"
+
+
+def product_generation(product_id):
+    return f"product:{product_id}"
+
+
+def get_category_tree():
+    """
+    Return ``{"data": [...], "etag": '"..."'}`` for the parent/children
+    category tree, serialized once per version and served from the cache.
+    """
+    key = f"{CATEGORY_TREE}:{get_cache_version(CATEGORY_TREE)}"
+    tree = cache.get(key)
+    if tree is None:
+        tree = _build_category_tree(list(_category_tree_queryset()))
+        cache.set(key, tree, CATEGORY_TREE_TIMEOUT)
+    return tree
+
+
+async def aget_category_tree():
+    """Async `get_category_tree()`."""
+    key = f"{CATEGORY_TREE}:{await aget_cache_version(CATEGORY_TREE)}"
+    tree = await cache.aget(key)
+    if tree is None:
+        tree = _build_category_tree([category async for category in _category_tree_queryset()])
+        await cache.aset(key, tree, CATEGORY_TREE_TIMEOUT)
+    return tree
+
+
+def _category_tree_queryset():
+    # Built once per version and cached, so read the primary: a lagging
+    # replica would cache the tree from before the change
+    return Category.objects.using(DEFAULT_DB_ALIAS).filter(parent__isnull=True).prefetch_related("children")
+
+
+def _build_category_tree(parents):
+    data = list(CategorySerializer(parents, many=True).data)
+    return {"data": data, "etag": make_etag(data)}
+
+
+def invalidate_category_tree():
+    bump_cache_version(CATEGORY_TREE)
+
+
+def invalidate_catalog():
+    """Drop every cached catalog response."""
+    bump_cache_version(CATALOG)
+
+
+def invalidate_products(product_ids, category_ids):
+    """
+    Drop cached responses showing the given products: the product list,
+    their detail pages and the listings of their categories and parents.
+    """
+    category_ids = set(category_ids)
+    category_ids.update(
+        Category.objects.filter(pk__in=category_ids, parent__isnull=False)
+        .values_list("parent_id", flat=True)
+    )
+    bump_cache_versions([
+        PRODUCTS,
+        *(product_generation(pk) for pk in product_ids),
+        *(category_generation(pk) for pk in category_ids),
+    ])
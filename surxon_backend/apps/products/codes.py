@@ -0,0 +1,96 @@
+import os
+import re
+import string
+import threading
+from collections import deque
+
+from django.apps import apps
+from django.db import connections, router
+
+SEQUENCE_NAME = "products_product_code_seq"
+
+LETTERS = string.ascii_uppercase
+# "AAA-0000" .. "ZZZ-9999"
+CODE_SPACE = len(LETTERS) ** 3 * 10 ** 4
+CODE_RE = re.compile(r"^[A-Z]{3}-[0-9]{4}$")
+
+# n -> (n * MULTIPLIER + OFFSET) % CODE_SPACE is a permutation of the code
+# space because MULTIPLIER is coprime with it (2^7 * 5^4 * 13^3), so
+# consecutive sequence values map to distinct, non-adjacent codes
+MULTIPLIER = 104_729_071
+OFFSET = 31_337_000
+
+
+def encode_code(number):
+    """
+    Map a sequence value to its product code, e.g. 0 -> "EQN-7000".
+    """
+    index = (number * MULTIPLIER + OFFSET) % CODE_SPACE
+    letters, digits = divmod(index, 10 ** 4)
+    first, rest = divmod(letters, len(LETTERS) ** 2)
+    second, third = divmod(rest, len(LETTERS))
+    return f"{LETTERS[first]}{LETTERS[second]}{LETTERS[third]}-{digits:04d}"
+
+
+class CodeAllocator:
+    """
+    Allocates unique product codes without a per-code query.
+
+    Codes come from a Postgres sequence scrambled by `encode_code`, so
+    concurrent writers never receive the same code. Each process reserves a
+    block of sequence values in one query and serves codes from that pool.
+    """
+
+    def __init__(self, block_size=100):
+        self.block_size = block_size
+        self._lock = threading.Lock()
+        self._pool = deque()
+        self._pid = os.getpid()
+
+    def allocate(self, count=1, using=None):
+        """
+        Return ``count`` unused product codes.
+        """
+        with self._lock:
+            if self._pid != os.getpid():
+                # Forked worker: never reuse codes reserved by the parent
+                self._pool.clear()
+                self._pid = os.getpid()
+
+            missing = count - len(self._pool)
+            if missing > 0:
+                self._pool.extend(self._reserve(max(missing, self.block_size), using))
+            return [self._pool.popleft() for _ in range(count)]
+
+    def _reserve(self, count, using=None):
+        Product = apps.get_model("products", "Product")
+        db = using or router.db_for_write(Product)
+
+        codes = []
+        while len(codes) < count:
+            needed = count - len(codes)
+            with connections[db].cursor() as cursor:
+                cursor.execute(
+                    "SELECT nextval(%s) FROM generate_series(1, %s)",
+                    [SEQUENCE_NAME, needed],
+                )
+                batch = [encode_code(number) for (number,) in cursor.fetchall()]
+
+            # Codes issued by the previous random generator may already exist
+            taken = set(
+                Product.objects.using(db)
+                .filter(code__in=batch)
+                .values_list("code", flat=True)
+            )
+            codes.extend(code for code in batch if code not in taken)
+        return codes
+
+
+allocator = CodeAllocator()
+
+
+def allocate_product_codes(count=1, using=None):
+    """
+    Allocate ``count`` unique product codes, e.g. for bulk imports.
+    """
+    return allocator.allocate(count, using=using)
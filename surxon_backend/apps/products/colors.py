@@ -0,0 +1,128 @@
+import threading
+
+import numpy as np
+from django.apps import apps
+from django.db import DEFAULT_DB_ALIAS
+
+from utils.cache import bump_cache_version, get_cache_version
+
+PRODUCT_COLORS = "product-colors"
+# ProductColor stores L*, a*, b* multiplied by this
+LAB_SCALE = 100
+
+# sRGB (D65) to CIE XYZ, and the D65 reference white
+RGB_TO_XYZ = np.array([
+    [0.4124564, 0.3575761, 0.1804375],
+    [0.2126729, 0.7151522, 0.0721750],
+    [0.0193339, 0.1191920, 0.9503041],
+])
+WHITE_D65 = np.array([0.95047, 1.0, 1.08883])
+
+
+def hex_to_lab(hex_codes):
+    """
+    Convert ``#RRGGBB`` strings to an ``(n, 3)`` array of CIELAB values.
+    """
+    rgb = np.array(
+        [[int(code[i:i + 2], 16) for i in (1, 3, 5)] for code in hex_codes],
+        dtype=np.float64,
+    ).reshape(-1, 3) / 255
+    linear = np.where(rgb > 0.04045, ((rgb + 0.055) / 1.055) ** 2.4, rgb / 12.92)
+    xyz = linear @ RGB_TO_XYZ.T / WHITE_D65
+    f = np.where(xyz > (6 / 29) ** 3, np.cbrt(xyz), xyz / (3 * (6 / 29) ** 2) + 4 / 29)
+    return np.stack([
+        116 * f[:, 1] - 16,
+        500 * (f[:, 0] - f[:, 1]),
+        200 * (f[:, 1] - f[:, 2]),
+    ], axis=1)
+
+
+class ColorIndex:
+    """
+    In-memory index of every product color for nearest-color queries.
+
+    Colors are held as float32 CIELAB columns, so the distance (CIE76
+    delta E) to every color is computed in one vectorized pass and the
+    nearest ones are selected with a partial sort. The arrays are rebuilt
+    on the next query after `invalidate_color_index` bumps the shared
+    version, so every process picks up changes.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._version = None
+        # (3, n) L*, a*, b* columns, hex code and product position per color
+        self._lab = np.empty((3, 0), dtype=np.float32)
+        self._hex = np.empty(0, dtype=object)
+        self._groups = np.empty(0, dtype=np.int32)
+        self._product_ids = np.empty(0, dtype=object)
+
+    def nearest(self, hex_code, limit=20, max_distance=None):
+        """
+        Return ``[(product_id, hex, distance), ...]`` for the ``limit``
+        products whose closest color is nearest to ``hex_code``.
+        """
+        lab, hex_codes, groups, product_ids = self._load()
+        count = lab.shape[1]
+        if not count:
+            return []
+
+        # Squared distances; the square root is only taken for the results
+        target = hex_to_lab([hex_code])[0].astype(np.float32)
+        distances = np.zeros(count, dtype=np.float32)
+        for column, value in zip(lab, target):
+            delta = column - value
+            delta *= delta
+            distances += delta
+
+        # Products can have several colors, so widen the candidate colors
+        # until they cover `limit` products (or every color)
+        candidates = min(count, limit * 4)
+        while True:
+            if candidates < count:
+                nearest = np.argpartition(distances, candidates - 1)[:candidates]
+            else:
+                nearest = np.arange(count)
+            nearest = nearest[np.argsort(distances[nearest], kind="stable")]
+            # First occurrence is the product's closest color
+            _, first = np.unique(groups[nearest], return_index=True)
+            if len(first) >= limit or candidates == count:
+                break
+            candidates = min(count, candidates * 4)
+
+        nearest = nearest[np.sort(first)[:limit]]
+        if max_distance is not None:
+            nearest = nearest[distances[nearest] <= max_distance ** 2]
+        return [
+            (product_ids[groups[index]], hex_codes[index], round(float(np.sqrt(distances[index])), 2))
+            for index in nearest.tolist()
+        ]
+
+    def _load(self):
+        version = get_cache_version(PRODUCT_COLORS)
+        with self._lock:
+            if version != self._version:
+                ProductColor = apps.get_model("products", "ProductColor")
+                # The primary: a lagging replica would keep the index stale
+                # until the next bump
+                rows = list(
+                    ProductColor.objects.using(DEFAULT_DB_ALIAS)
+                    .values_list("product_id", "hex", "lab_l", "lab_a", "lab_b")
+                )
+                product_ids, groups = np.unique(
+                    np.array([row[0] for row in rows], dtype=object), return_inverse=True
+                )
+                lab = np.array([row[2:] for row in rows], dtype=np.float32).reshape(-1, 3) / LAB_SCALE
+                self._lab = np.ascontiguousarray(lab.T)
+                self._hex = np.array([row[1] for row in rows], dtype=object)
+                self._groups = groups.astype(np.int32)
+                self._product_ids = product_ids
+                self._version = version
+            return self._lab, self._hex, self._groups, self._product_ids
+
+
+color_index = ColorIndex()
+
+
+def invalidate_color_index():
+    bump_cache_version(PRODUCT_COLORS)
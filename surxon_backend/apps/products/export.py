@@ -0,0 +1,90 @@
+import csv
+import io
+import zlib
+
+from asgiref.sync import sync_to_async
+from rest_framework.utils.encoders import JSONEncoder
+
+from .models.products import Product
+from .serializers import ProductListValuesSerializer
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+# Rows fetched per server-side cursor round trip
+CURSOR_CHUNK_SIZE = 2000
+# Rows encoded into one streamed chunk
+ROWS_PER_CHUNK = 500
+
+
+def export_queryset():
+    """
+    The full catalog in a stable order, read through a server-side cursor.
+    """
+    return ProductListValuesSerializer.setup_queryset(
+        Product.objects.order_by("created_at", "id")
+    ).iterator(chunk_size=CURSOR_CHUNK_SIZE)
+
+
+def iter_export(export_format, products=None):
+    """
+    Yield the catalog as NDJSON or CSV text chunks with the
+    product list fields. Memory use is bounded by the chunk size,
+    not by the size of the catalog.
+    """
+    products = export_queryset() if products is None else products
+    serializer = ProductListValuesSerializer()
+    fields = ProductListValuesSerializer.Meta.fields
+
+    buffer = io.StringIO()
+    if export_format == "csv":
+        writer = csv.writer(buffer)
+        writer.writerow(fields)
+
+        def write(row):
+            writer.writerow([row[field] for field in fields])
+    else:
+        encoder = JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+        def write(row):
+            buffer.write(encoder.encode(row))
+            buffer.write("\n")
+
+    for count, product in enumerate(products, start=1):
+        write(serializer.to_representation(product))
+        if count % ROWS_PER_CHUNK == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def gzip_chunks(chunks):
+    """
+    Compress a stream of text chunks into a gzip stream.
+    """
+    compressor = zlib.compressobj(6, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode())
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+async def aiter_chunks(chunks):
+    """
+    Serve a sync chunk iterator asynchronously, one chunk at a time.
+
+    Under ASGI, Django reads a sync streaming iterator into a list before
+    sending it. Each chunk is pulled in the request's sync thread instead,
+    so the server-side cursor stays on that thread's connection.
+    """
+    next_chunk = sync_to_async(next)
+    try:
+        while (chunk := await next_chunk(chunks, None)) is not None:
+            yield chunk
+    finally:
+        # Closes the cursor on its own thread
+        await sync_to_async(chunks.close)()
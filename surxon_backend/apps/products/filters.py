@@ -0,0 +1,157 @@
+import uuid
+from decimal import Decimal, InvalidOperation
+
+from django.db import connections
+from django.db.models import Count, Max, Min, Q
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
+
+from utils.validate_color_codes import HEX_COLOR_RE
+
+TRUE_VALUES = ("true", "1", "yes")
+FALSE_VALUES = ("false", "0", "no")
+
+
+class ProductFacetFilter(BaseFilterBackend):
+    """
+    Filters product listings by price range, brand, discount and color, and
+    computes facet counts for the filtered listing.
+
+    Query params:
+      - min_price / max_price: range of the price after discount (inclusive)
+      - brand: comma-separated brand ids
+      - has_discount: true / false
+      - color: comma-separated HEX colors (#RRGGBB), matches any of them
+      - facets: true to include facet counts in the response
+
+    Facet counts are disjunctive: each facet ignores its own filter, so the
+    client can show how many products every other option would return.
+    """
+    facets_query_param = "facets"
+    max_color_facets = 50
+
+    def filter_queryset(self, request, queryset, view):
+        filters = self.get_filters(request)
+        return queryset.filter(*filters.values())
+
+    @classmethod
+    def facets_requested(cls, request):
+        return request.query_params.get(cls.facets_query_param, "").lower() in TRUE_VALUES
+
+    def get_filters(self, request):
+        """
+        Parse the filter query params into a ``{facet: Q}`` mapping.
+        """
+        params = request.query_params
+        errors = {}
+        filters = {}
+
+        price = Q()
+        for param, lookup in (("min_price", "final_price__gte"), ("max_price", "final_price__lte")):
+            if params.get(param):
+                try:
+                    price &= Q(**{lookup: Decimal(params[param])})
+                except InvalidOperation:
+                    errors[param] = "A valid number is required."
+        if price:
+            filters["price"] = price
+
+        if params.get("brand"):
+            try:
+                brand_ids = [uuid.UUID(value) for value in _split(params["brand"])]
+                filters["brand"] = Q(brand_id__in=brand_ids)
+            except ValueError:
+                errors["brand"] = "Must be a comma-separated list of brand ids."
+
+        if params.get("has_discount"):
+            value = params["has_discount"].lower()
+            if value in TRUE_VALUES:
+                filters["discount"] = Q(discount_percentage__gt=0)
+            elif value in FALSE_VALUES:
+                filters["discount"] = Q(discount_percentage=0)
+            else:
+                errors["has_discount"] = "Must be true or false."
+
+        if params.get("color"):
+            colors = _split(params["color"])
+            if not all(HEX_COLOR_RE.fullmatch(color) for color in colors):
+                errors["color"] = "Must be a comma-separated list of HEX colors (#RRGGBB)."
+            else:
+                color = Q()
+                for value in colors:
+                    # Stored codes are not case-normalized
+                    for variant in {value.upper(), value.lower()}:
+                        color |= Q(color_codes__contains=[variant])
+                filters["color"] = color
+
+        if errors:
+            raise ValidationError(errors)
+        return filters
+
+    def get_facets(self, request, queryset):
+        """
+        Return facet counts for ``queryset`` (the listing before filtering)
+        using three grouped queries regardless of how many filters are set.
+        """
+        filters = self.get_filters(request)
+        queryset = queryset.order_by()
+
+        def excluding(*facets):
+            return queryset.filter(*(q for name, q in filters.items() if name not in facets))
+
+        brands = (
+            excluding("brand")
+            .filter(brand__isnull=False)
+            .values("brand_id", "brand__name")
+            .annotate(count=Count("id"))
+            .order_by("-count", "brand__name")
+        )
+
+        # Discount counts ignore the discount filter and the price range
+        # ignores the price filter, so both are conditional aggregates
+        price_q = filters.get("price", Q())
+        discount_q = filters.get("discount")
+        stats = excluding("price", "discount").aggregate(
+            discounted=Count("id", filter=price_q & Q(discount_percentage__gt=0)),
+            not_discounted=Count("id", filter=price_q & Q(discount_percentage=0)),
+            min_price=Min("final_price", filter=discount_q),
+            max_price=Max("final_price", filter=discount_q),
+        )
+
+        return {
+            "price": {"min": _price_str(stats["min_price"]), "max": _price_str(stats["max_price"])},
+            "has_discount": {"true": stats["discounted"], "false": stats["not_discounted"]},
+            "brands": [
+                {"id": row["brand_id"], "name": row["brand__name"], "count": row["count"]}
+                for row in brands
+            ],
+            "colors": self.get_color_facets(excluding("color")),
+        }
+
+    def get_color_facets(self, queryset):
+        """
+        Count products per color by unnesting ``color_codes`` in SQL.
+        """
+        sql, params = queryset.values("id", "color_codes").query.sql_with_params()
+        with connections[queryset.db].cursor() as cursor:
+            cursor.execute(
+                f"""
+                SELECT UPPER(c.color), COUNT(DISTINCT p.id)
+                FROM ({sql}) AS p
+                CROSS JOIN LATERAL jsonb_array_elements_text(p.color_codes) AS c(color)
+                GROUP BY 1
+                ORDER BY 2 DESC, 1
+                LIMIT %s
+                """,
+                (*params, self.max_color_facets),
+            )
+            return [{"color": color, "count": count} for color, count in cursor.fetchall()]
+
+
+def _price_str(value):
+    """Format like the serialized `price` field ("123.45")."""
+    return None if value is None else str(value.quantize(Decimal("0.01")))
+
+
+def _split(value):
+    return [item.strip() for item in value.split(",") if item.strip()]
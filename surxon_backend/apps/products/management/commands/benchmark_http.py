@@ -0,0 +1,142 @@
+import asyncio
+import statistics
+import time
+from collections import Counter
+from urllib.parse import urlsplit
+
+from django.core.management.base import BaseCommand, CommandError
+
+DEFAULT_PATHS = ("/api/products/", "/api/products/categories/")
+
+
+class Command(BaseCommand):
+    help = (
+        "Load-test a running server with concurrent keep-alive clients and "
+        "report throughput and latency, e.g. to compare `runserver` with the "
+        "gunicorn/uvicorn serve mode."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--url", default="http://127.0.0.1:8000",
+            help="Server to test (default: http://127.0.0.1:8000)",
+        )
+        parser.add_argument(
+            "--path", action="append", dest="paths",
+            help="Path to request, repeatable; clients cycle through them "
+                 f"(default: {', '.join(DEFAULT_PATHS)})",
+        )
+        parser.add_argument(
+            "--concurrency", "-c", type=int, default=50,
+            help="Concurrent clients (default: 50)",
+        )
+        parser.add_argument(
+            "--duration", "-d", type=float, default=10.0,
+            help="Seconds to run (default: 10)",
+        )
+        parser.add_argument(
+            "--header", action="append", dest="headers", default=[],
+            help="Extra request header as 'Name: value', repeatable",
+        )
+
+    def handle(self, *args, **options):
+        url = urlsplit(options["url"])
+        if url.scheme != "http" or not url.hostname:
+            raise CommandError("--url must be an http:// URL.")
+        if options["concurrency"] < 1 or options["duration"] <= 0:
+            raise CommandError("--concurrency and --duration must be positive.")
+
+        headers = []
+        for header in options["headers"]:
+            name, sep, value = header.partition(":")
+            if not sep:
+                raise CommandError(f"Invalid header: {header!r}")
+            headers.append((name.strip(), value.strip()))
+
+        results = asyncio.run(self._run(
+            url.hostname, url.port or 80, options["paths"] or DEFAULT_PATHS, headers,
+            options["concurrency"], options["duration"],
+        ))
+        self._report(results, options["duration"])
+
+    async def _run(self, host, port, paths, headers, concurrency, duration):
+        deadline = time.monotonic() + duration
+        results = {"latencies": [], "statuses": Counter(), "errors": Counter()}
+        await asyncio.gather(*(
+            self._client(index, host, port, paths, headers, deadline, results)
+            for index in range(concurrency)
+        ))
+        return results
+
+    async def _client(self, index, host, port, paths, headers, deadline, results):
+        extra = "".join(f"{name}: {value}\r\n" for name, value in headers)
+        requests = [
+            f"GET {path} HTTP/1.1\r\nHost: {host}\r\nConnection: keep-alive\r\n{extra}\r\n".encode()
+            for path in paths
+        ]
+        reader = writer = None
+        sent = index
+        while time.monotonic() < deadline:
+            try:
+                if writer is None:
+                    reader, writer = await asyncio.open_connection(host, port)
+                started = time.perf_counter()
+                writer.write(requests[sent % len(requests)])
+                sent += 1
+                status, keep_alive = await _read_response(reader)
+                results["latencies"].append(time.perf_counter() - started)
+                results["statuses"][status] += 1
+            except (OSError, asyncio.IncompleteReadError, ValueError) as exc:
+                results["errors"][type(exc).__name__] += 1
+                keep_alive = False
+            if not keep_alive and writer is not None:
+                writer.close()
+                reader = writer = None
+        if writer is not None:
+            writer.close()
+
+    def _report(self, results, duration):
+        latencies = sorted(results["latencies"])
+        if not latencies:
+            raise CommandError(f"No successful requests ({dict(results['errors'])}).")
+
+        def percentile(fraction):
+            return latencies[min(len(latencies) - 1, int(len(latencies) * fraction))] * 1000
+
+        self.stdout.write(f"Requests:   {len(latencies)} in {duration:.1f}s")
+        self.stdout.write(f"Throughput: {len(latencies) / duration:.1f} req/s")
+        self.stdout.write(
+            f"Latency:    mean {statistics.fmean(latencies) * 1000:.1f} ms, "
+            f"p50 {percentile(0.5):.1f} ms, p95 {percentile(0.95):.1f} ms, "
+            f"p99 {percentile(0.99):.1f} ms"
+        )
+        self.stdout.write(f"Statuses:   {dict(sorted(results['statuses'].items()))}")
+        if results["errors"]:
+            self.stdout.write(self.style.WARNING(f"Errors:     {dict(results['errors'])}"))
+
+
+async def _read_response(reader):
+    """
+    Read one HTTP/1.1 response, discarding the body. Returns
+    ``(status, keep_alive)``.
+    """
+    status_line = await reader.readuntil(b"\r\n")
+    status = int(status_line.split()[1])
+    headers = {}
+    while (line := await reader.readuntil(b"\r\n")) != b"\r\n":
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip().lower()
+
+    if headers.get("transfer-encoding") == "chunked":
+        while size := int((await reader.readuntil(b"\r\n")).split(b";")[0], 16):
+            await reader.readexactly(size + 2)
+        # Trailers end with an empty line
+        while await reader.readuntil(b"\r\n") != b"\r\n":
+            pass
+    elif "content-length" in headers:
+        await reader.readexactly(int(headers["content-length"]))
+    elif status not in (204, 304):
+        # Body runs until the server closes the connection
+        await reader.read()
+        return status, False
+    return status, headers.get("connection") != "close"
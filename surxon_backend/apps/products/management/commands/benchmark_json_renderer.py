@@ -0,0 +1,72 @@
+import io
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from apps.products.models import Product
+from apps.products.serializers import ProductListValuesSerializer
+from utils.parsers import ORJSONParser
+from utils.renderers import ORJSONRenderer
+from utils.response_format import APIResponse
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare JSONRenderer/JSONParser with the orjson renderer and parser on "
+        "a product list page wrapped in the API envelope."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--page-size", type=int, default=100,
+            help="Products per page (default: 100)",
+        )
+        parser.add_argument(
+            "--iterations", type=int, default=500,
+            help="Timed runs per renderer (default: 500)",
+        )
+
+    def handle(self, *args, **options):
+        page_size = options["page_size"]
+        iterations = options["iterations"]
+        if page_size < 1 or iterations < 1:
+            raise CommandError("--page-size and --iterations must be positive.")
+
+        rows = ProductListValuesSerializer.setup_queryset(
+            Product.objects.order_by("-created_at")
+        )[:page_size]
+        data = APIResponse.paginated_success(
+            data=ProductListValuesSerializer(rows, many=True).data,
+            count=Product.objects.count(),
+            next_url="http://testserver/api/products/?page=2",
+            message="Products retrieved successfully",
+        ).data
+
+        body = JSONRenderer().render(data)
+        if ORJSONRenderer().render(data) != body:
+            raise CommandError("The renderers produced different output.")
+        self.stdout.write(f"Payload: {len(body)} bytes, {page_size} products")
+
+        for label, renderer, parser in (
+            ("JSONRenderer/JSONParser", JSONRenderer(), JSONParser()),
+            ("ORJSONRenderer/ORJSONParser", ORJSONRenderer(), ORJSONParser()),
+        ):
+            render_cpu = self._cpu_time(lambda renderer=renderer: renderer.render(data), iterations)
+            parse_cpu = self._cpu_time(lambda parser=parser: parser.parse(io.BytesIO(body)), iterations)
+            self.stdout.write(
+                f"{label}: render {render_cpu * 1000:.3f} ms CPU "
+                f"({len(body) / render_cpu / 2 ** 20:.0f} MiB/s), "
+                f"parse {parse_cpu * 1000:.3f} ms CPU "
+                f"({len(body) / parse_cpu / 2 ** 20:.0f} MiB/s)"
+            )
+
+    @staticmethod
+    def _cpu_time(func, iterations):
+        func()  # warm up
+        started = time.process_time()
+        for _ in range(iterations):
+            func()
+        return (time.process_time() - started) / iterations
+
@@ -0,0 +1,60 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.products.models import Product
+from apps.products.serializers import ProductListSerializer, ProductListValuesSerializer
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare fetching and serializing one product list page with the model "
+        "serializer and with the values() fast path."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--page-size", type=int, default=100,
+            help="Products per page (default: 100)",
+        )
+        parser.add_argument(
+            "--iterations", type=int, default=200,
+            help="Timed runs per serializer (default: 200)",
+        )
+
+    def handle(self, *args, **options):
+        page_size = options["page_size"]
+        iterations = options["iterations"]
+        if page_size < 1 or iterations < 1:
+            raise CommandError("--page-size and --iterations must be positive.")
+
+        def model_page():
+            queryset = (
+                Product.objects.select_related("category", "brand")
+                .defer("search_vector")
+                .order_by("-created_at")
+            )
+            return ProductListSerializer(queryset[:page_size], many=True).data
+
+        def values_page():
+            queryset = ProductListValuesSerializer.setup_queryset(
+                Product.objects.order_by("-created_at")
+            )
+            return ProductListValuesSerializer(queryset[:page_size], many=True).data
+
+        if model_page() != values_page():
+            raise CommandError("The serializers produced different output.")
+
+        baseline = self._time(model_page, iterations)
+        fast = self._time(values_page, iterations)
+        self.stdout.write(f"ProductListSerializer:       {baseline * 1000:.2f} ms/page")
+        self.stdout.write(f"ProductListValuesSerializer: {fast * 1000:.2f} ms/page")
+        self.stdout.write(f"Speedup: {baseline / fast:.1f}x at page size {page_size}")
+
+    @staticmethod
+    def _time(func, iterations):
+        func()  # warm up
+        started = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        return (time.perf_counter() - started) / iterations
@@ -0,0 +1,48 @@
+import sys
+import time
+from contextlib import ExitStack
+
+from django.core.management.base import BaseCommand
+
+from apps.products.export import EXPORT_FORMATS, gzip_chunks, iter_export
+
+
+class Command(BaseCommand):
+    help = (
+        "Stream the full catalog as NDJSON or CSV, with the same fields as the "
+        "product listing. Rows are read through a server-side cursor."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--output", "-o", default="-",
+            help="Output file, or - for stdout (default: -)",
+        )
+        parser.add_argument(
+            "--format", choices=list(EXPORT_FORMATS), default="ndjson",
+            help="Output format (default: ndjson)",
+        )
+        parser.add_argument(
+            "--gzip", action="store_true",
+            help="Compress the output with gzip",
+        )
+
+    def handle(self, *args, **options):
+        path = options["output"]
+        chunks = iter_export(options["format"])
+        chunks = gzip_chunks(chunks) if options["gzip"] else (chunk.encode() for chunk in chunks)
+
+        started = time.monotonic()
+        written = 0
+        with ExitStack() as stack:
+            if path == "-":
+                stream = sys.stdout.buffer
+                stack.callback(stream.flush)
+            else:
+                stream = stack.enter_context(open(path, "wb"))
+            for chunk in chunks:
+                stream.write(chunk)
+                written += len(chunk)
+
+        elapsed = time.monotonic() - started
+        self.stderr.write(f"Wrote {written} bytes in {elapsed:.1f}s.")
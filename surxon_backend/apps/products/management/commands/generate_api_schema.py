@@ -0,0 +1,43 @@
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate the OpenAPI schema once and write it in every spec format "
+        "to API_SCHEMA_ROOT, where the docs views serve it from instead of "
+        "generating it on the first request."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--output", default=None,
+            help="Directory to write to (default: API_SCHEMA_ROOT)",
+        )
+
+    def handle(self, *args, **options):
+        if not settings.API_DOCS_ENABLED:
+            self.stdout.write("API docs are disabled (API_DOCS_ENABLED), nothing to generate.")
+            return
+        from config.docs import BaseSchemaView, generate_schema
+
+        output = options["output"] or settings.API_SCHEMA_ROOT
+        os.makedirs(output, exist_ok=True)
+        schema = generate_schema()
+
+        written = set()
+        for renderer_class in BaseSchemaView.renderer_classes:
+            renderer_format = renderer_class.format.lstrip(".")
+            if renderer_format in written:
+                continue
+            path = os.path.join(output, f"swagger.{renderer_format}")
+            # Replace atomically, running servers may be reading the file
+            with open(f"{path}.tmp", "wb") as file:
+                file.write(renderer_class().render(schema))
+            os.replace(f"{path}.tmp", path)
+            written.add(renderer_format)
+            self.stdout.write(f"Wrote {path}")
+
+        self.stdout.write(self.style.SUCCESS(f"Generated the API schema in {len(written)} formats"))
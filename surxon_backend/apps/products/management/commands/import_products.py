@@ -0,0 +1,208 @@
+import csv
+import json
+import sys
+import time
+from contextlib import ExitStack
+from decimal import Decimal
+
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from apps.brands.models import Brand
+from apps.products.cache import invalidate_catalog
+from apps.products.codes import CODE_RE, allocate_product_codes
+from apps.products.colors import invalidate_color_index
+from apps.products.models import Category, Product, ProductColor
+from utils import validate_hex_color_codes
+
+# Columns written on insert and overwritten when an existing code is imported
+UPDATE_FIELDS = [
+    "title", "description", "price", "discount_percentage", "color_codes",
+    "category", "brand", "updated_at",
+]
+
+
+class Command(BaseCommand):
+    help = (
+        "Stream products from a CSV or JSONL file into the catalog in chunks. "
+        "Columns: title, description, price, category (id or slug), and optional "
+        "discount_percentage, color_codes, brand (id) and code. Rows whose code "
+        "already exists update that product."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="CSV/JSONL file, or - for stdin")
+        parser.add_argument(
+            "--format", choices=["csv", "jsonl"],
+            help="Input format (default: from the file extension)",
+        )
+        parser.add_argument(
+            "--chunk-size", type=int, default=1000,
+            help="Rows validated and written per transaction (default: 1000)",
+        )
+        parser.add_argument(
+            "--max-errors", type=int, default=20,
+            help="Number of invalid rows to print (default: 20)",
+        )
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        fmt = options["format"] or ("jsonl" if path.endswith((".jsonl", ".ndjson")) else "csv")
+        chunk_size = options["chunk_size"]
+        if chunk_size < 1:
+            raise CommandError("--chunk-size must be positive.")
+
+        self.max_errors = options["max_errors"]
+        self.error_count = 0
+        self.categories = self._load_categories()
+        self.brand_ids = {str(pk) for pk in Brand.objects.values_list("id", flat=True)}
+
+        started = time.monotonic()
+        imported = 0
+        with ExitStack() as stack:
+            stream = sys.stdin if path == "-" else stack.enter_context(
+                open(path, newline="", encoding="utf-8")
+            )
+            try:
+                if fmt == "jsonl":
+                    rows, first_line = self._read_jsonl(stream), 1
+                else:
+                    rows, first_line = csv.DictReader(stream), 2
+                chunk = []
+                for line, row in enumerate(rows, start=first_line):
+                    if row is None:
+                        continue
+                    product = self._build_product(line, row)
+                    if product is not None:
+                        chunk.append(product)
+                    if len(chunk) >= chunk_size:
+                        imported += self._write(chunk)
+                        chunk = []
+                        self._report(imported, started)
+                if chunk:
+                    imported += self._write(chunk)
+            finally:
+                if imported:
+                    # bulk_create sends no signals
+                    invalidate_catalog()
+                    invalidate_color_index()
+
+        elapsed = time.monotonic() - started
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {imported} products in {elapsed:.1f}s "
+            f"({imported / elapsed if elapsed else 0:.0f} rows/s), "
+            f"{self.error_count} invalid rows skipped."
+        ))
+
+    def _load_categories(self):
+        """
+        Map category id and slug to ``(id, is_child)`` in one query.
+        """
+        categories = {}
+        for pk, slug, parent_id in Category.objects.values_list("id", "slug", "parent_id"):
+            categories[str(pk)] = categories[slug] = (pk, parent_id is not None)
+        return categories
+
+    def _read_jsonl(self, stream):
+        # Lines are decoded in _build_product so bad JSON only skips that row
+        for line in stream:
+            yield line if line.strip() else None
+
+    def _build_product(self, line, row):
+        """
+        Validate one input row against the preloaded maps and return an
+        unsaved Product, or None after reporting why the row was skipped.
+        """
+        try:
+            if isinstance(row, str):
+                row = json.loads(row)
+                if not isinstance(row, dict):
+                    raise ValidationError("Each line must be a JSON object.")
+            category = self.categories.get(str(row.get("category") or "").strip())
+            if category is None:
+                raise ValidationError({"category": "Unknown category."})
+            category_id, is_child = category
+            if not is_child:
+                raise ValidationError({"category": "Products can only be linked to child categories."})
+
+            brand_id = str(row.get("brand") or "").strip() or None
+            if brand_id is not None and brand_id not in self.brand_ids:
+                raise ValidationError({"brand": "Unknown brand."})
+
+            code = str(row.get("code") or "").strip()
+            if code and not CODE_RE.match(code):
+                raise ValidationError({"code": "Must look like ABC-1234."})
+
+            color_codes = self._parse_colors(row.get("color_codes"))
+            try:
+                validate_hex_color_codes(color_codes)
+            except ValidationError as exc:
+                raise ValidationError({"color_codes": exc.message})
+
+            product = Product(
+                title=row.get("title") or "",
+                description=row.get("description") or "",
+                price=row.get("price"),
+                discount_percentage=row.get("discount_percentage") or Decimal(0),
+                color_codes=color_codes,
+                category_id=category_id,
+                brand_id=brand_id,
+                code=code,
+            )
+            # Field-level checks (lengths, decimals, ranges); no queries
+            product.clean_fields(exclude=["id", "category", "brand", "color_codes"])
+            return product
+        except (ValidationError, ValueError, TypeError) as exc:
+            self.error_count += 1
+            if self.error_count <= self.max_errors:
+                detail = exc.message_dict if hasattr(exc, "error_dict") else exc
+                self.stderr.write(f"Row {line}: {detail}")
+            return None
+
+    def _parse_colors(self, value):
+        if value in (None, ""):
+            return []
+        if isinstance(value, list):
+            return value
+        if not isinstance(value, str):
+            raise ValidationError({"color_codes": "Must be a list or a comma-separated string."})
+        value = value.strip()
+        if value.startswith("["):
+            return json.loads(value)
+        return [color.strip() for color in value.replace(";", ",").split(",") if color.strip()]
+
+    def _write(self, products):
+        """
+        Insert a chunk in one transaction; rows with an existing code update
+        that product instead.
+        """
+        # A code may only be upserted once per statement; the last row wins
+        products = list({
+            product.code or product.pk: product for product in products
+        }.values())
+        missing = [product for product in products if not product.code]
+        for product, code in zip(missing, allocate_product_codes(len(missing))):
+            product.code = code
+
+        with transaction.atomic():
+            Product.objects.bulk_create(
+                products,
+                update_conflicts=True,
+                unique_fields=["code"],
+                update_fields=UPDATE_FIELDS,
+            )
+            # Updated rows keep their existing id, not the one generated here
+            ids = dict(
+                Product.objects.filter(code__in=[product.code for product in products])
+                .values_list("code", "id")
+            )
+            for product in products:
+                product.pk = ids[product.code]
+            ProductColor.objects.replace(products)
+        return len(products)
+
+    def _report(self, imported, started):
+        elapsed = time.monotonic() - started
+        rate = imported / elapsed if elapsed else 0
+        self.stdout.write(f"{imported} rows imported ({rate:.0f} rows/s)")
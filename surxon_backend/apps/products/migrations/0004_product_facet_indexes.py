@@ -0,0 +1,41 @@
+# Generated by Django 5.2.9 on 2026-10-18 12:31
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("brands", "0001_initial"),
+        ("products", "0003_product_search_vector"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="product",
+            index=models.Index(fields=["price"], name="product_price_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="product",
+            index=models.Index(
+                fields=["brand", "-created_at"], name="product_brand_created_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="product",
+            index=models.Index(
+                condition=models.Q(("discount_percentage__gt", 0)),
+                fields=["-created_at"],
+                name="product_discounted_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="product",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["color_codes"],
+                name="product_color_codes_idx",
+                opclasses=["jsonb_path_ops"],
+            ),
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.9 on 2026-10-18 12:34
+
+import django.db.models.expressions
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("brands", "0001_initial"),
+        ("products", "0004_product_facet_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="product",
+            name="final_price",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.db.models.expressions.CombinedExpression(
+                    models.F("price"),
+                    "-",
+                    django.db.models.expressions.CombinedExpression(
+                        django.db.models.expressions.CombinedExpression(
+                            models.F("price"), "*", models.F("discount_percentage")
+                        ),
+                        "/",
+                        models.Value(100),
+                    ),
+                ),
+                output_field=models.DecimalField(decimal_places=6, max_digits=14),
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="product",
+            index=models.Index(
+                fields=["final_price", "id"], name="product_final_price_idx"
+            ),
+        ),
+    ]
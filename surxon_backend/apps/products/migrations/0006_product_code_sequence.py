@@ -0,0 +1,23 @@
+# Generated by Django 5.2.9 on 2026-10-18 12:34
+
+from django.db import migrations
+
+# One value per possible "ABC-1234" code (26^3 * 10^4), see apps/products/codes.py
+CREATE_SEQUENCE_SQL = """
+CREATE SEQUENCE products_product_code_seq
+MINVALUE 0 MAXVALUE 175759999 START 0 NO CYCLE
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("products", "0005_product_final_price"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            CREATE_SEQUENCE_SQL,
+            "DROP SEQUENCE IF EXISTS products_product_code_seq",
+        ),
+    ]
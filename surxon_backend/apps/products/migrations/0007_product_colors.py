@@ -0,0 +1,93 @@
+# Generated by Django 5.2.9 on 2026-10-18 12:50
+
+import re
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+HEX_COLOR_RE = re.compile(r"^#[0-9A-F]{6}$")
+
+
+def backfill_colors(apps, schema_editor):
+    from apps.products.colors import LAB_SCALE, hex_to_lab
+
+    Product = apps.get_model("products", "Product")
+    ProductColor = apps.get_model("products", "ProductColor")
+    db = schema_editor.connection.alias
+
+    def flush(pairs):
+        if not pairs:
+            return
+        lab = (
+            (hex_to_lab([hex_code for _, hex_code in pairs]) * LAB_SCALE)
+            .round()
+            .astype(int)
+        )
+        ProductColor.objects.using(db).bulk_create(
+            ProductColor(product_id=product_id, hex=hex_code, lab_l=lightness, lab_a=a_star, lab_b=b_star)
+            for (product_id, hex_code), (lightness, a_star, b_star) in zip(pairs, lab.tolist())
+        )
+
+    pairs = []
+    products = Product.objects.using(db).values_list("id", "color_codes")
+    for product_id, color_codes in products.iterator(chunk_size=2000):
+        if not isinstance(color_codes, list):
+            continue
+        hex_codes = dict.fromkeys(
+            code.upper() for code in color_codes if isinstance(code, str)
+        )
+        pairs.extend(
+            (product_id, hex_code)
+            for hex_code in hex_codes
+            if HEX_COLOR_RE.match(hex_code)
+        )
+        if len(pairs) >= 5000:
+            flush(pairs)
+            pairs = []
+    flush(pairs)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("products", "0006_product_code_sequence"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProductColor",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("hex", models.CharField(max_length=7)),
+                ("lab_l", models.SmallIntegerField()),
+                ("lab_a", models.SmallIntegerField()),
+                ("lab_b", models.SmallIntegerField()),
+                (
+                    "product",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="colors",
+                        to="products.product",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Product color",
+                "verbose_name_plural": "Product colors",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("product", "hex"), name="product_color_unique"
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_colors, migrations.RunPython.noop),
+    ]
@@ -1,4 +1,5 @@
 from .categories import Category
 from .products import Product
+from .colors import ProductColor
 
-__all__ = ["Category", "Product"]
\ No newline at end of file
+__all__ = ["Category", "Product", "ProductColor"]
\ No newline at end of file
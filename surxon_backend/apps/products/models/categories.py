@@ -1,8 +1,30 @@
-from django.db import models
+from django.db import IntegrityError, models, router, transaction
 from django.utils.text import slugify
 from django.core.exceptions import ValidationError
 
 from utils import AbstractBaseModel
+from ..slugs import assign_slugs, next_free_slug
+
+# Attempts at saving with a freshly generated slug before giving up when
+# concurrent saves keep taking it first
+SLUG_SAVE_ATTEMPTS = 3
+
+
+class CategoryQuerySet(models.QuerySet):
+    def bulk_create_with_slugs(self, categories, **kwargs):
+        """
+        Bulk insert categories, generating missing slugs with one query.
+
+        Parents must already be saved and be parent categories; no other
+        `clean()` validation runs on this path.
+        """
+        parent_ids = {category.parent_id for category in categories if category.parent_id}
+        if self.filter(pk__in=parent_ids, parent__isnull=False).exists():
+            raise ValidationError({
+                "parent": "A child category cannot be linked to another child category."
+            })
+        assign_slugs(self, categories)
+        return self.bulk_create(categories, **kwargs)
 
 
 class Category(AbstractBaseModel):
@@ -19,6 +41,8 @@ class Category(AbstractBaseModel):
         blank=True,
         related_name="children"
     )
+
+    objects = CategoryQuerySet.as_manager()
     
     class Meta:
         verbose_name = "Category"
@@ -49,19 +73,28 @@ class Category(AbstractBaseModel):
                 })
     
     def save(self, *args, **kwargs):
-        # Generate slug from name if not provided
-        if not self.slug:
-            base_slug = slugify(self.name)
-            slug = base_slug
-            counter = 1
-            while Category.objects.filter(slug=slug).exclude(pk=self.pk).exists():
-                slug = f"{base_slug}-{counter}"
-                counter += 1
-            self.slug = slug
-        
         # Run validation
         self.clean()
-        super().save(*args, **kwargs)
+
+        if self.slug:
+            super().save(*args, **kwargs)
+            return
+
+        # Generate slug from name; a concurrent save may take the same slug
+        # first, in which case the unique index rejects ours and we retry
+        base_slug = slugify(self.name)
+        using = kwargs.get("using") or router.db_for_write(Category, instance=self)
+        others = Category.objects.using(using).exclude(pk=self.pk)
+        for attempt in range(SLUG_SAVE_ATTEMPTS):
+            self.slug = next_free_slug(others, base_slug)
+            try:
+                with transaction.atomic(using=using):
+                    super().save(*args, **kwargs)
+                return
+            except IntegrityError:
+                self.slug = ""
+                if attempt == SLUG_SAVE_ATTEMPTS - 1:
+                    raise
     
     @property
     def is_parent(self):
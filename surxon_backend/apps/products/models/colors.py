@@ -0,0 +1,68 @@
+from django.db import models
+
+from ..colors import LAB_SCALE, hex_to_lab
+from .products import Product
+
+
+class ProductColorQuerySet(models.QuerySet):
+    def build(self, product_id, color_codes):
+        """
+        Return unsaved rows for a product's colors, skipping duplicates.
+        """
+        hex_codes = list(dict.fromkeys(code.upper() for code in color_codes or ()))
+        if not hex_codes:
+            return []
+        lab = (hex_to_lab(hex_codes) * LAB_SCALE).round().astype(int)
+        return [
+            ProductColor(product_id=product_id, hex=hex_code, lab_l=lightness, lab_a=a_star, lab_b=b_star)
+            for hex_code, (lightness, a_star, b_star) in zip(hex_codes, lab.tolist())
+        ]
+
+    def replace(self, products):
+        """
+        Rewrite the color rows of ``products`` from their `color_codes`.
+        Returns True if any row changed.
+        """
+        products = list(products)
+        current = {}
+        for product_id, hex_code in self.filter(product__in=products).values_list("product_id", "hex"):
+            current.setdefault(product_id, set()).add(hex_code)
+
+        stale = []
+        rows = []
+        for product in products:
+            new_rows = self.build(product.pk, product.color_codes)
+            if {row.hex for row in new_rows} != current.get(product.pk, set()):
+                stale.append(product.pk)
+                rows.extend(new_rows)
+        if not stale:
+            return False
+        self.filter(product_id__in=stale).delete()
+        self.bulk_create(rows)
+        return True
+
+
+class ProductColor(models.Model):
+    """
+    One color of a product in CIELAB, derived from `Product.color_codes`.
+
+    L*, a* and b* are stored in hundredths as small integers so a row stays
+    a few bytes and the whole table loads quickly into `ColorIndex`.
+    """
+    product = models.ForeignKey(Product, on_delete=models.CASCADE, related_name="colors")
+    hex = models.CharField(max_length=7)
+    lab_l = models.SmallIntegerField()
+    lab_a = models.SmallIntegerField()
+    lab_b = models.SmallIntegerField()
+
+    objects = ProductColorQuerySet.as_manager()
+
+    class Meta:
+        verbose_name = "Product color"
+        verbose_name_plural = "Product colors"
+        constraints = [
+            models.UniqueConstraint(fields=["product", "hex"], name="product_color_unique"),
+        ]
+
+    def __str__(self):
+        return f"{self.product_id} {self.hex}"
@@ -1,10 +1,11 @@
-import string
-import random
 from django.db import models
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.core.exceptions import ValidationError
 
-from utils import AbstractBaseModel
+from utils import AbstractBaseModel, validate_hex_color_codes
+from ..codes import allocate_product_codes
 from .categories import Category
 
 
@@ -42,6 +43,15 @@ class Product(AbstractBaseModel):
         help_text="Discount percentage (0-100)"
     )
     
+    # Price after discount, computed and stored by the database so listings
+    # can filter, sort and index on it. Keeps full precision so it always
+    # equals `discounted_price`.
+    final_price = models.GeneratedField(
+        expression=models.F("price") - models.F("price") * models.F("discount_percentage") / 100,
+        output_field=models.DecimalField(max_digits=14, decimal_places=6),
+        db_persist=True,
+    )
+
     # Link to child category only
     category = models.ForeignKey(
         Category,
@@ -60,10 +70,39 @@ class Product(AbstractBaseModel):
         help_text="Optional link to the product's brand"
     )
 
+    # Weighted full-text document (title > description), kept up to date by
+    # the products_product_search_vector trigger
+    search_vector = SearchVectorField(null=True, editable=False)
+
     class Meta:
         verbose_name = "Product"
         verbose_name_plural = "Products"
         ordering = ["-created_at"]
+        indexes = [
+            # Keyset pagination on (created_at, id) for the product listings
+            models.Index(fields=["-created_at", "-id"], name="product_created_id_idx"),
+            models.Index(
+                fields=["category", "-created_at", "-id"],
+                name="product_cat_created_id_idx",
+            ),
+            GinIndex(fields=["search_vector"], name="product_search_vector_idx"),
+            # Facet filters: price range, brand, discount and color containment
+            models.Index(fields=["price"], name="product_price_idx"),
+            models.Index(fields=["final_price", "id"], name="product_final_price_idx"),
+            models.Index(fields=["brand", "-created_at"], name="product_brand_created_idx"),
+            models.Index(
+                fields=["-created_at"],
+                name="product_discounted_idx",
+                condition=models.Q(discount_percentage__gt=0),
+            ),
+            GinIndex(
+                fields=["color_codes"],
+                name="product_color_codes_idx",
+                opclasses=["jsonb_path_ops"],
+            ),
+            # Trigram index so partial codes ("MNK-02") match without a scan
+            GinIndex(fields=["code"], name="product_code_trgm_idx", opclasses=["gin_trgm_ops"]),
+        ]
     
     def __str__(self):
         return f"{self.code} - {self.title}"
@@ -78,27 +117,10 @@ class Product(AbstractBaseModel):
             })
         
         # Validate color codes format
-        if self.color_codes:
-            if not isinstance(self.color_codes, list):
-                raise ValidationError({
-                    "color_codes": "Color codes must be a list of HEX color codes."
-                })
-            
-            for color in self.color_codes:
-                if not isinstance(color, str) or not color.startswith("#") or len(color) != 7:
-                    raise ValidationError({
-                        "color_codes": f"Invalid HEX color code: {color}. "
-                                     "Use format #RRGGBB (e.g., #FF0000)"
-                    })
-                
-                # Validate HEX characters
-                try:
-                    int(color[1:], 16)
-                except ValueError:
-                    raise ValidationError({
-                        "color_codes": f"Invalid HEX color code: {color}. "
-                                     "Contains non-hexadecimal characters."
-                    })
+        try:
+            validate_hex_color_codes(self.color_codes)
+        except ValidationError as exc:
+            raise ValidationError({"color_codes": exc.message})
     
     def save(self, *args, **kwargs):
         # Generate unique product code if not provided
@@ -113,16 +135,7 @@ class Product(AbstractBaseModel):
         """
         Generate a unique product code in format "ABC-1234"
         """
-        while True:
-            # Generate 3 random uppercase letters
-            letters = "".join(random.choices(string.ascii_uppercase, k=3))
-            # Generate 4 random digits
-            digits = "".join(random.choices(string.digits, k=4))
-            code = f"{letters}-{digits}"
-            
-            # Check if code is unique
-            if not Product.objects.filter(code=code).exists():
-                return code
+        return allocate_product_codes(1, using=self._state.db)[0]
     
     @property
     def discounted_price(self):
@@ -1,4 +1,6 @@
+from django.utils.functional import cached_property
 from rest_framework import serializers
+from utils.fieldsets import SparseFieldsetMixin
 from .models.categories import Category
 from .models.products import Product
 
@@ -20,6 +22,8 @@ class CategorySerializer(serializers.ModelSerializer):
 class ProductListSerializer(serializers.ModelSerializer):
     """Serializer for product list view"""
     category = serializers.CharField(source='category.name', read_only=True)
+    # Read from the generated `final_price` column instead of computing per row
+    discounted_price = serializers.FloatField(source='final_price', read_only=True)
     
     class Meta:
         model = Product
@@ -27,10 +31,61 @@ class ProductListSerializer(serializers.ModelSerializer):
                  "discount_percentage", "discounted_price", "has_discount")
 
 
-class ProductDetailSerializer(serializers.ModelSerializer):
+class ProductListValuesSerializer(SparseFieldsetMixin, ProductListSerializer):
+    """
+    Read-only fast path for product lists.
+
+    Serializes rows selected with `setup_queryset` (plain `values()` dicts)
+    into the same JSON as `ProductListSerializer`, without building model
+    instances or running the per-field machinery. The declared fields are
+    inherited, so the API schema is unchanged. Supports `?fields=` and
+    `?exclude=`; only the columns of the selected fields are read.
+    """
+    field_columns = {
+        "category": ("category__name",),
+        "discounted_price": ("final_price",),
+        "has_discount": ("discount_percentage",),
+    }
+    # Keyset pagination reads the values of the sortable columns
+    required_columns = ("id", "created_at", "price", "final_price")
+
+    # Decimal columns come back at their column scale, which matches
+    # DRF's quantized string output
+    renderers = {
+        "id": lambda row: str(row["id"]),
+        "title": lambda row: row["title"],
+        "description": lambda row: row["description"],
+        "price": lambda row: f"{row['price']:f}",
+        "category": lambda row: row["category__name"],
+        "code": lambda row: row["code"],
+        "discount_percentage": lambda row: f"{row['discount_percentage']:f}",
+        "discounted_price": lambda row: float(row["final_price"]),
+        "has_discount": lambda row: row["discount_percentage"] > 0,
+    }
+
+    @classmethod
+    def setup_queryset(cls, queryset, request=None):
+        return queryset.values(*cls.get_columns(request))
+
+    @cached_property
+    def _row_renderers(self):
+        return [(name, self.renderers[name]) for name in self.fields]
+
+    def to_representation(self, row):
+        return {name: render(row) for name, render in self._row_renderers}
+
+
+class ProductDetailSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """Serializer for product detail view with all required fields"""
     category = serializers.CharField(source='category.name', read_only=True)
     color_code = serializers.SerializerMethodField()
+
+    field_columns = {
+        "color_code": ("color_codes",),
+        "category": ("category__name",),
+        "discounted_price": ("price", "discount_percentage"),
+        "has_discount": ("discount_percentage",),
+    }
     
     class Meta:
         model = Product
@@ -43,3 +98,10 @@ class ProductDetailSerializer(serializers.ModelSerializer):
         if obj.color_codes and isinstance(obj.color_codes, list) and len(obj.color_codes) > 0:
             return obj.color_codes[0]
         return None
+
+    @classmethod
+    def setup_queryset(cls, queryset, request=None):
+        columns = cls.get_columns(request)
+        if "category__name" not in columns:
+            queryset = queryset.select_related(None)
+        return queryset.only(*columns)
@@ -0,0 +1,62 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+
+from apps.brands.models import Brand
+
+from .cache import invalidate_catalog, invalidate_category_tree, invalidate_products
+from .colors import invalidate_color_index
+from .models.categories import Category
+from .models.colors import ProductColor
+from .models.products import Product
+
+
+@receiver([post_save, post_delete], sender=Category)
+def category_changed(sender, **kwargs):
+    """Drop the cached category tree whenever a category changes."""
+    # After commit: bumping earlier would let a concurrent request cache
+    # the old rows under the new version
+    transaction.on_commit(invalidate_category_tree)
+    # Category names are embedded in every product response
+    transaction.on_commit(invalidate_catalog)
+
+
+@receiver([post_save, post_delete], sender=Brand)
+def brand_changed(sender, **kwargs):
+    """Brand names appear in listing facets."""
+    transaction.on_commit(invalidate_catalog)
+
+
+@receiver(post_init, sender=Product)
+def remember_category(sender, instance, **kwargs):
+    # Read from __dict__ so a deferred column is not fetched
+    instance._loaded_category_id = instance.__dict__.get("category_id")
+
+
+@receiver([post_save, post_delete], sender=Product)
+def product_changed(sender, instance, **kwargs):
+    """
+    Drop cached responses showing the product, including the listing of
+    the category it was moved out of.
+    """
+    category_id = instance.__dict__.get("category_id")
+    category_ids = {category_id, instance._loaded_category_id} - {None}
+    instance._loaded_category_id = category_id
+    # Captured now: a delete clears `instance.pk` before an outer commit
+    product_id = instance.pk
+    transaction.on_commit(lambda: invalidate_products([product_id], category_ids))
+
+
+@receiver(post_save, sender=Product)
+def sync_product_colors(sender, instance, update_fields=None, **kwargs):
+    """Keep the CIELAB color rows in step with `color_codes`."""
+    if update_fields is not None and "color_codes" not in update_fields:
+        return
+    if ProductColor.objects.replace([instance]):
+        transaction.on_commit(invalidate_color_index)
+
+
+@receiver(post_delete, sender=Product)
+def drop_product_colors(sender, **kwargs):
+    # The color rows are removed by the cascade
+    transaction.on_commit(invalidate_color_index)
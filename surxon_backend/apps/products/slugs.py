@@ -0,0 +1,53 @@
+import re
+
+from django.db.models.functions import Length
+from django.utils.text import slugify
+
+# Numeric suffixes as generated below ("-1", "-2", ...), never zero-padded
+SUFFIX_PATTERN = "-[1-9][0-9]*"
+
+
+def next_free_slug(queryset, base):
+    """
+    Return ``base`` or ``base-N`` with the next free suffix in one query.
+
+    The ``startswith`` filter uses the slug's ``varchar_pattern_ops`` index;
+    the regex only narrows the few rows sharing the prefix. The highest
+    suffix is the longest, then lexically greatest, matching slug.
+    """
+    last = (
+        queryset.filter(slug__startswith=base, slug__regex=rf"^{re.escape(base)}({SUFFIX_PATTERN})?$")
+        .order_by(Length("slug").desc(), "-slug")
+        .values_list("slug", flat=True)
+        .first()
+    )
+    if last is None:
+        return base
+    suffix = last[len(base) + 1:]
+    return f"{base}-{int(suffix or 0) + 1}"
+
+
+def assign_slugs(queryset, instances):
+    """
+    Give every instance without a slug a unique one derived from its name,
+    loading all conflicting slugs in a single query.
+    """
+    pending = [(obj, slugify(obj.name)) for obj in instances if not obj.slug]
+    if not pending:
+        return
+
+    bases = {base for _, base in pending}
+    pattern = "^({})({})?$".format("|".join(re.escape(base) for base in bases), SUFFIX_PATTERN)
+    used = set(queryset.filter(slug__regex=pattern).values_list("slug", flat=True))
+    used.update(obj.slug for obj in instances if obj.slug)
+
+    next_suffix = {}
+    for obj, base in pending:
+        suffix = next_suffix.get(base, 0)
+        slug = base if suffix == 0 else f"{base}-{suffix}"
+        while slug in used:
+            suffix += 1
+            slug = f"{base}-{suffix}"
+        used.add(slug)
+        next_suffix[base] = suffix + 1
+        obj.slug = slug
@@ -0,0 +1,101 @@
+import time
+
+from django.db import transaction
+from django.http import HttpResponse
+from django.test import RequestFactory, TransactionTestCase, override_settings
+
+from apps.authentication.models import CustomUser
+from utils.replicas import ReplicaPinningMiddleware, ReplicaRouter, _pinned, _wrote
+
+from .models.categories import Category
+from .models.products import Product
+
+
+@override_settings(DATABASE_REPLICAS=["replica_1"], REPLICA_LAG_WINDOW=5)
+class ReplicaRoutingTests(TransactionTestCase):
+    """
+    `ReplicaRouter` and `ReplicaPinningMiddleware` against a "replica_1"
+    alias that mirrors the test database.
+
+    A TransactionTestCase: TestCase runs each test inside a transaction on
+    the primary, where the router reads the primary by design.
+    """
+    databases = {"default", "replica_1"}
+
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.middleware = ReplicaPinningMiddleware(lambda request: HttpResponse())
+        self._reset()
+        self.addCleanup(self._reset)
+
+    def _reset(self):
+        _pinned.set(False)
+        _wrote.set(False)
+
+    def test_safe_reads_go_to_a_replica(self):
+        self.middleware.process_request(self.factory.get("/api/products/"))
+        self.assertEqual(Product.objects.all().db, "replica_1")
+        with self.assertNumQueries(1, using="replica_1"):
+            list(Product.objects.all())
+
+    def test_other_apps_read_the_primary(self):
+        self.assertEqual(CustomUser.objects.all().db, "default")
+
+    def test_write_pins_reads_to_the_primary(self):
+        self.assertEqual(ReplicaRouter().db_for_write(Product), "default")
+        self.assertEqual(Product.objects.all().db, "default")
+
+    def test_orm_write_pins_the_request(self):
+        self.middleware.process_request(self.factory.get("/api/products/"))
+        Category.objects.create(name="Chairs")
+        self.assertTrue(_wrote.get())
+        self.assertEqual(Category.objects.all().db, "default")
+
+    def test_unsafe_requests_are_pinned(self):
+        self.middleware.process_request(self.factory.post("/api/products/"))
+        self.assertEqual(Product.objects.all().db, "default")
+
+    def test_reads_in_an_atomic_block_go_to_the_primary(self):
+        with transaction.atomic():
+            self.assertEqual(Product.objects.all().db, "default")
+        self.assertEqual(Product.objects.all().db, "replica_1")
+
+    def test_write_sets_the_pinning_cookie(self):
+        request = self.factory.get("/api/products/")
+        self.middleware.process_request(request)
+        ReplicaRouter().db_for_write(Product)
+        response = self.middleware.process_response(request, HttpResponse())
+
+        cookie = response.cookies[ReplicaPinningMiddleware.cookie_name]
+        self.assertEqual(cookie["max-age"], 5)
+        self.assertAlmostEqual(float(cookie.value), time.time() + 5, delta=1)
+        # The state does not leak into the next request on this thread
+        self.assertFalse(_pinned.get())
+        self.assertFalse(_wrote.get())
+
+    def test_cookie_pins_reads_within_the_lag_window(self):
+        request = self.factory.get("/api/products/")
+        request.COOKIES[ReplicaPinningMiddleware.cookie_name] = f"{time.time() + 5:.3f}"
+        self.middleware.process_request(request)
+        self.assertEqual(Product.objects.all().db, "default")
+
+    def test_expired_or_invalid_cookie_does_not_pin(self):
+        for value in (f"{time.time() - 1:.3f}", "not-a-timestamp"):
+            with self.subTest(value=value):
+                request = self.factory.get("/api/products/")
+                request.COOKIES[ReplicaPinningMiddleware.cookie_name] = value
+                self.middleware.process_request(request)
+                self.assertEqual(Product.objects.all().db, "replica_1")
+
+    def test_no_cookie_without_replicas(self):
+        with self.settings(DATABASE_REPLICAS=[]):
+            request = self.factory.get("/api/products/")
+            self.middleware.process_request(request)
+            ReplicaRouter().db_for_write(Product)
+            response = self.middleware.process_response(request, HttpResponse())
+        self.assertNotIn(ReplicaPinningMiddleware.cookie_name, response.cookies)
+
+    def test_migrations_are_not_run_on_replicas(self):
+        router = ReplicaRouter()
+        self.assertFalse(router.allow_migrate("replica_1", "products"))
+        self.assertTrue(router.allow_migrate("default", "products"))
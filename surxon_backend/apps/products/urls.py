@@ -2,12 +2,28 @@ from .views import (
     category_list_view, 
     product_list_view,
     product_detail_view,
+    product_search_view,
+    product_export_view,
+    product_color_search_view,
     product_list_by_category_view as product_filter_view
 )
+from django.conf import settings
 from django.urls import path
 
+from . import async_views
+
+if settings.ASYNC_CATALOG_VIEWS:
+    # Async counterparts of the read-only catalog views (ASGI serve mode)
+    category_list_view = async_views.category_list_view
+    product_list_view = async_views.product_list_view
+    product_detail_view = async_views.product_detail_view
+    product_filter_view = async_views.product_list_by_category_view
+
 urlpatterns = [
     path("", product_list_view, name="product-list"),
+    path("search/", product_search_view, name="product-search"),
+    path("export/", product_export_view, name="product-export"),
+    path("colors/similar/", product_color_search_view, name="product-color-search"),
     path("<uuid:product_id>/", product_detail_view, name="product-detail"),
     path("categories/", category_list_view, name="category-list"),
     path("categories/<uuid:category_id>/", product_filter_view, name="product-list-by-category")
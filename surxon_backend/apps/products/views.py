@@ -1,13 +1,31 @@
+import math
+
 from rest_framework import generics, permissions
-from django.shortcuts import get_object_or_404
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import OrderingFilter
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.core.handlers.asgi import ASGIRequest
+from django.db.models import Case, F, Q, Value, When
+from django.http import Http404, StreamingHttpResponse
 
+from .cache import (
+    CATALOG, PRODUCTS, category_generation, get_category_tree, product_generation
+)
+from .colors import color_index
+from .export import EXPORT_FORMATS, aiter_chunks, gzip_chunks, iter_export
+from .filters import ProductFacetFilter
 from .models.categories import Category
 from .models.products import Product
 from .serializers import (
-    CategorySerializer, ProductListSerializer, ProductDetailSerializer
+    CategorySerializer, ProductDetailSerializer, ProductListValuesSerializer
+)
+from utils.conditional import (
+    ConditionalListMixin, ConditionalRetrieveMixin, not_modified_response
 )
+from utils.cache import CachedResponseMixin
 from utils.response_format import APIResponse
-from utils.pagination import CustomPageNumberPagination
+from utils.validate_color_codes import HEX_COLOR_RE
+from utils.pagination import CatalogPagination, CustomPageNumberPagination, KeysetPagination
 
 
 class CategoryListAPIView(generics.ListAPIView):
@@ -15,6 +33,10 @@ class CategoryListAPIView(generics.ListAPIView):
     Returns all parent categories (those with no parent) and for each parent
     includes its child categories in the `children` list.
 
+    The serialized tree is cached (see `get_category_tree`) and carries a
+    strong ETag, so a warm request runs no queries and `If-None-Match`
+    gets a 304.
+
     URL (when included under `api/products/`): GET /api/products/categories/
     """
     permission_classes = [permissions.AllowAny]
@@ -22,37 +44,108 @@ class CategoryListAPIView(generics.ListAPIView):
     serializer_class = CategorySerializer
 
     def list(self, request, *args, **kwargs):
-        queryset = self.get_queryset()
-        serializer = self.get_serializer(queryset, many=True)
-        return APIResponse.success(
-            data=serializer.data,
+        tree = get_category_tree()
+        not_modified = not_modified_response(request, etag=tree["etag"])
+        if not_modified is not None:
+            return not_modified
+
+        response = APIResponse.success(
+            data=tree["data"],
             message="Categories retrieved successfully"
         )
+        response["ETag"] = tree["etag"]
+        return response
+
+
+class FacetedListMixin:
+    """
+    Adds facet counts (`?facets=true`) and sorting (`?ordering=`) to a
+    paginated product listing.
+    """
+    filter_backends = [ProductFacetFilter, OrderingFilter]
+    # `final_price` is the price after discount
+    ordering_fields = ["created_at", "price", "final_price"]
+    ordering = ["-created_at"]
+
+    def get_conditional_queryset(self):
+        # Facet counts span rows outside the filtered listing
+        if ProductFacetFilter.facets_requested(self.request):
+            return self.get_queryset()
+        return super().get_conditional_queryset()
+
+    def list(self, request, *args, **kwargs):
+        response = super().list(request, *args, **kwargs)
+        if ProductFacetFilter.facets_requested(request):
+            response.data["facets"] = ProductFacetFilter().get_facets(request, self.get_queryset())
+        return response
+
+
+class CatalogListMixin(CachedResponseMixin, FacetedListMixin, ConditionalListMixin):
+    """
+    Response caching, conditional GET and facets for the paginated product
+    listings.
+    """
+    conditional_fields = ("updated_at", "category__updated_at")
+    conditional_headers = ("X-Client-Version",)
+    cache_vary_headers = conditional_headers
+    fingerprint_ignored_params = (
+        CatalogPagination.page_query_param,
+        CatalogPagination.page_size_query_param,
+        KeysetPagination.cursor_query_param,
+        KeysetPagination.mode_query_param,
+    )
+
+    def get_conditional_generations(self):
+        # Every product, category and brand change bumps these
+        return self.get_cache_generations()
 
 
-class ProductListAPIView(generics.ListAPIView):
+class ProductListAPIView(CatalogListMixin, generics.ListAPIView):
     """
     Returns paginated list of all products.
+    Supports keyset pagination with `?pagination=cursor` / `?cursor=`,
+    the filters and facets of `ProductFacetFilter`, price sorting with
+    `?ordering=final_price` / `-final_price` / `price` / `-price`,
+    `If-None-Match`, and sparse fieldsets with `?fields=` / `?exclude=`.
+    Anonymous responses are cached until any product, category or brand
+    changes.
 
     URL: GET /api/products/
     """
     permission_classes = [permissions.AllowAny]
-    queryset = Product.objects.select_related("category", "brand").order_by("-created_at")
-    serializer_class = ProductListSerializer
-    pagination_class = CustomPageNumberPagination
+    serializer_class = ProductListValuesSerializer
+    pagination_class = CatalogPagination
+
+    def get_cache_generations(self):
+        return [CATALOG, PRODUCTS]
+
+    def get_queryset(self):
+        return ProductListValuesSerializer.setup_queryset(
+            Product.objects.order_by("-created_at"), self.request
+        )
 
 
-class ProductDetailAPIView(generics.RetrieveAPIView):
+class ProductDetailAPIView(CachedResponseMixin, ConditionalRetrieveMixin, generics.RetrieveAPIView):
     """
     Returns detailed information about a specific product.
+    Supports `If-None-Match` / `If-Modified-Since` and sparse fieldsets
+    with `?fields=` / `?exclude=`. Anonymous responses are cached until the
+    product, its category or a brand changes.
 
     URL: GET /api/products/<uuid:product_id>/
     """
     permission_classes = [permissions.AllowAny]
-    queryset = Product.objects.select_related("category", "brand")
+    queryset = Product.objects.select_related("category")
     serializer_class = ProductDetailSerializer
     lookup_field = 'id'
     lookup_url_kwarg = 'product_id'
+    conditional_fields = ("updated_at", "category__updated_at")
+
+    def get_cache_generations(self):
+        return [CATALOG, product_generation(self.kwargs["product_id"])]
+
+    def get_queryset(self):
+        return ProductDetailSerializer.setup_queryset(super().get_queryset(), self.request)
 
     def retrieve(self, request, *args, **kwargs):
         instance = self.get_object()
@@ -63,37 +156,204 @@ class ProductDetailAPIView(generics.RetrieveAPIView):
         )
 
 
-class ProductListByCategoryAPIView(generics.ListAPIView):
+class ProductListByCategoryAPIView(CatalogListMixin, generics.ListAPIView):
     """
     Returns paginated products under a specific category. Behavior:
     - If the category is a parent (no parent), return products from all its child categories.
     - If the category is a child (has a parent), return products from that category only.
+    Supports the same filters, facets, sorting and sparse fieldsets as the
+    product list. Anonymous responses are cached until a product in the
+    category subtree, a category or a brand changes.
+
+    The category subtree is resolved by a subquery inside the product query,
+    so a page costs one query plus the count. Whether the category exists is
+    only checked when the page comes back empty.
 
     URL example (when included under `api/products/`):
       GET /api/products/categories/<uuid:category_id>/products/
     """
     permission_classes = [permissions.AllowAny]
-    serializer_class = ProductListSerializer
-    pagination_class = CustomPageNumberPagination
+    serializer_class = ProductListValuesSerializer
+    pagination_class = CatalogPagination
+
+    def get_cache_generations(self):
+        return [CATALOG, category_generation(self.kwargs["category_id"])]
 
     def get_queryset(self):
         category_id = self.kwargs.get("category_id")
-        category = get_object_or_404(Category, pk=category_id)
+        # Children of a parent category, or the child category itself
+        subtree = Category.objects.filter(
+            Q(parent_id=category_id) | Q(pk=category_id, parent__isnull=False)
+        ).values("id")
+
+        return ProductListValuesSerializer.setup_queryset(
+            Product.objects.filter(category_id__in=subtree).order_by("-created_at"),
+            self.request,
+        )
+
+    def paginate_queryset(self, queryset):
+        page = super().paginate_queryset(queryset)
+        if not page and not Category.objects.filter(pk=self.kwargs.get("category_id")).exists():
+            raise Http404
+        return page
+
+
+class ProductSearchAPIView(generics.ListAPIView):
+    """
+    Ranked product search over title and description (full-text, title
+    weighted above description) and partial product codes (trigram index).
+
+    URL: GET /api/products/search/?q=<query>
+    """
+    permission_classes = [permissions.AllowAny]
+    serializer_class = ProductListValuesSerializer
+    pagination_class = CustomPageNumberPagination
+    # Shorter fragments cannot use the trigram index on `code`
+    min_code_length = 3
+
+    def get_queryset(self):
+        term = self.request.query_params.get("q", "").strip()
+        if not term:
+            raise ValidationError({"q": "This query parameter is required."})
+
+        query = SearchQuery(term, config="simple", search_type="websearch")
+        condition = Q(search_vector=query)
+        code_boost = Value(0.0)
+        if len(term) >= self.min_code_length:
+            # Product codes are generated upper-case ("MNK-0258")
+            code_match = Q(code__contains=term.upper())
+            condition |= code_match
+            code_boost = Case(When(code_match, then=Value(1.0)), default=Value(0.0))
+
+        return ProductListValuesSerializer.setup_queryset(
+            Product.objects.filter(condition)
+            .annotate(rank=SearchRank(F("search_vector"), query) + code_boost)
+            .order_by("-rank", "-created_at")
+        )
+
+
+class ProductColorSearchAPIView(generics.GenericAPIView):
+    """
+    Returns the products whose colors are closest to a given color, nearest
+    first, using the in-memory CIELAB index (see `ColorIndex`).
+
+    Query params:
+      - color: HEX color (#RRGGBB, the # is optional)
+      - limit: number of products (default 20, max 100)
+      - max_distance: optional CIE76 delta E cut-off (about 2.3 is a just
+        noticeable difference)
+
+    Each product carries the matched color and its distance, and supports
+    `?fields=` / `?exclude=` for the product fields.
+
+    URL: GET /api/products/colors/similar/?color=%23F5F5DC
+    """
+    permission_classes = [permissions.AllowAny]
+    serializer_class = ProductListValuesSerializer
+    default_limit = 20
+    max_limit = 100
+
+    def get(self, request, *args, **kwargs):
+        color, limit, max_distance = self.get_params()
+        matches = color_index.nearest(color, limit=limit, max_distance=max_distance)
+
+        rows = ProductListValuesSerializer.setup_queryset(
+            Product.objects.filter(pk__in=[product_id for product_id, _, _ in matches]),
+            request,
+        )
+        rows = {row["id"]: row for row in rows}
+        serializer = self.get_serializer()
+        data = []
+        for product_id, hex_code, distance in matches:
+            # Skip products deleted since the index was loaded
+            if product_id in rows:
+                item = serializer.to_representation(rows[product_id])
+                item.update(matched_color=hex_code, distance=distance)
+                data.append(item)
+
+        return APIResponse.success(
+            data=data,
+            message="Products retrieved successfully"
+        )
+
+    def get_params(self):
+        params = self.request.query_params
+        errors = {}
+
+        color = params.get("color", "").strip()
+        if color and not color.startswith("#"):
+            color = f"#{color}"
+        if not HEX_COLOR_RE.fullmatch(color):
+            errors["color"] = "A HEX color (#RRGGBB) is required."
+
+        limit = self.default_limit
+        if params.get("limit"):
+            try:
+                limit = min(int(params["limit"]), self.max_limit)
+                if limit < 1:
+                    raise ValueError
+            except ValueError:
+                errors["limit"] = "Must be a positive integer."
+
+        max_distance = None
+        if params.get("max_distance"):
+            try:
+                max_distance = float(params["max_distance"])
+                if not math.isfinite(max_distance) or max_distance < 0:
+                    raise ValueError
+            except ValueError:
+                errors["max_distance"] = "A valid number is required."
+
+        if errors:
+            raise ValidationError(errors)
+        return color.upper(), limit, max_distance
+
+
+class ProductExportAPIView(generics.GenericAPIView):
+    """
+    Streams the full catalog for partner feeds, without pagination.
+
+    Query params:
+      - export_format: `ndjson` (default) or `csv`
+      - compression: `gzip` to download a gzip-compressed file
+
+    Rows are read through a server-side cursor and written as they are
+    serialized, so memory use does not grow with the catalog. Under ASGI the
+    chunks are served through an async iterator (see `aiter_chunks`).
+
+    URL: GET /api/products/export/
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request, *args, **kwargs):
+        export_format = request.query_params.get("export_format", "ndjson")
+        if export_format not in EXPORT_FORMATS:
+            raise ValidationError({"export_format": f"Must be one of: {', '.join(EXPORT_FORMATS)}."})
+        compression = request.query_params.get("compression")
+        if compression not in (None, "gzip"):
+            raise ValidationError({"compression": "Must be gzip."})
+
+        filename = f"products.{export_format}"
+        content_type = f"{EXPORT_FORMATS[export_format]}; charset=utf-8"
+        chunks = iter_export(export_format)
+        if compression:
+            filename += ".gz"
+            content_type = "application/gzip"
+            chunks = gzip_chunks(chunks)
 
-        if category.is_parent:
-            # Get all child category ids and return products belonging to them
-            child_ids = category.children.values_list("id", flat=True)
-            qs = Product.objects.filter(category_id__in=list(child_ids))
-        else:
-            # Child category: return products in this category only
-            qs = Product.objects.filter(category=category)
+        if isinstance(request._request, ASGIRequest):
+            chunks = aiter_chunks(chunks)
 
-        # optimize: bring related data in one query
-        return qs.select_related("category", "brand").order_by("-created_at")
+        response = StreamingHttpResponse(chunks, content_type=content_type)
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
 
 
 # View instances for URL patterns
 category_list_view = CategoryListAPIView.as_view()
 product_list_view = ProductListAPIView.as_view()
 product_detail_view = ProductDetailAPIView.as_view()
-product_list_by_category_view = ProductListByCategoryAPIView.as_view()
\ No newline at end of file
+product_list_by_category_view = ProductListByCategoryAPIView.as_view()
+product_search_view = ProductSearchAPIView.as_view()
+product_color_search_view = ProductColorSearchAPIView.as_view()
+product_export_view = ProductExportAPIView.as_view()
\ No newline at end of file
@@ -0,0 +1,125 @@
+"""
+Swagger / ReDoc documentation, included by `config/urls.py` only when
+`API_DOCS_ENABLED` is on.
+
+Generating the schema introspects every view and serializer, so each
+process does it once: the spec is rendered on the first request per format
+(or read from the files `generate_api_schema` writes to `API_SCHEMA_ROOT`)
+and later requests are answered from memory, with an ETag.
+"""
+import hashlib
+import os
+import threading
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.urls import re_path
+from django.utils.cache import patch_cache_control, quote_etag
+from drf_yasg import openapi
+from drf_yasg.renderers import _SpecRenderer
+from drf_yasg.views import get_schema_view
+from rest_framework import permissions
+
+from utils.conditional import not_modified_response
+
+API_INFO = openapi.Info(
+    title="Surxon Mebel Platform API",
+    default_version='v1',
+    description="API documentation for Surxon Mebel Platform",
+    terms_of_service="www.google.com",
+    contact=openapi.Contact(email="contact@surxonmebel.com"),
+    license=openapi.License(name="MIT License"),
+)
+
+BaseSchemaView = get_schema_view(
+    API_INFO,
+    public=True,
+    permission_classes=(permissions.AllowAny,),
+)
+
+
+def generate_schema(version=""):
+    """
+    Generate the schema without a request, so it does not depend on the
+    host it is served from (clients resolve paths against that host).
+    """
+    generator = BaseSchemaView.generator_class(API_INFO, version)
+    return generator.get_schema(request=None, public=True)
+
+
+def schema_file_path(renderer_format):
+    return os.path.join(settings.API_SCHEMA_ROOT, f"swagger.{renderer_format}")
+
+
+class SchemaCache:
+    """
+    Rendered specs per ``(version, renderer format)``, kept for the life of
+    the process: the schema only changes with the code.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._schemas = {}
+        self._documents = {}
+
+    def get(self, renderer, version=""):
+        """Return ``(content, etag)`` for ``renderer`` (a spec renderer)."""
+        # The compat renderers behind `swagger.json` use ".json" as format
+        renderer_format = renderer.format.lstrip(".")
+        key = (version, renderer_format)
+        document = self._documents.get(key)
+        if document is None:
+            with self._lock:
+                document = self._documents.get(key)
+                if document is None:
+                    content = self._read_file(renderer_format) if not version else None
+                    if content is None:
+                        content = renderer.render(self._get_schema(version))
+                    etag = quote_etag(hashlib.sha256(content).hexdigest()[:32])
+                    document = self._documents[key] = (content, etag)
+        return document
+
+    def _get_schema(self, version):
+        if version not in self._schemas:
+            self._schemas[version] = generate_schema(version)
+        return self._schemas[version]
+
+    def _read_file(self, renderer_format):
+        try:
+            with open(schema_file_path(renderer_format), "rb") as file:
+                return file.read()
+        except FileNotFoundError:
+            return None
+
+
+schema_cache = SchemaCache()
+
+
+class SchemaView(BaseSchemaView):
+    """
+    Serves the spec formats from `schema_cache`; the UI pages are static
+    and load the spec from ``?format=openapi``.
+    """
+
+    def get(self, request, version="", format=None):
+        renderer = request.accepted_renderer
+        if not isinstance(renderer, _SpecRenderer):
+            return super().get(request, version, format)
+
+        content, etag = schema_cache.get(renderer, request.version or version or "")
+        response = not_modified_response(request, etag=etag)
+        if response is None:
+            response = HttpResponse(
+                content, content_type=f"{request.accepted_media_type}; charset={renderer.charset}"
+            )
+            response["ETag"] = etag
+        # Revalidate: the ETag changes with every deploy that changes the API
+        patch_cache_control(response, no_cache=True)
+        return response
+
+
+urlpatterns = [
+    re_path(r'^swagger(?P<format>\.json|\.yaml)$', SchemaView.without_ui(), name='schema-json'),
+    re_path(r'^swagger/$', SchemaView.with_ui('swagger'), name='schema-swagger-ui'),
+    re_path(r'^redoc/$', SchemaView.with_ui('redoc'), name='schema-redoc'),
+]
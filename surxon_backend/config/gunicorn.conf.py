@@ -0,0 +1,41 @@
+"""
+Gunicorn settings for the ASGI serve mode (``docker/entrypoint.sh``).
+
+Gunicorn manages the worker processes and each worker runs the ASGI
+application (``config.asgi``) on a uvicorn event loop. All settings can be
+overridden from the environment:
+
+  - PORT: port to bind (default 8000)
+  - WEB_CONCURRENCY: worker processes (default: 2 per CPU, at most 8)
+  - GUNICORN_TIMEOUT: seconds before a silent worker is restarted
+  - GUNICORN_GRACEFUL_TIMEOUT: seconds a worker gets to finish its
+    in-flight requests on shutdown or reload
+  - GUNICORN_MAX_REQUESTS: recycle a worker after this many requests
+
+``kill -HUP <master pid>`` reloads gracefully: new workers are started with
+the new code and the old ones finish their in-flight requests first.
+"""
+
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+worker_class = "uvicorn_worker.UvicornWorker"
+workers = int(os.environ.get("WEB_CONCURRENCY", str(min(multiprocessing.cpu_count() * 2, 8))))
+
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", "30"))
+graceful_timeout = int(os.environ.get("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+keepalive = 5
+
+max_requests = int(os.environ.get("GUNICORN_MAX_REQUESTS", "10000"))
+max_requests_jitter = max_requests // 10
+
+accesslog = "-"
+errorlog = "-"
+
+
+def worker_exit(server, worker):
+    # Write logins buffered by this worker (see apps.authentication.logins)
+    from apps.authentication.logins import recorder
+
+    recorder.flush()
@@ -11,6 +11,7 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
 import os
+import sys
 from pathlib import Path
 from datetime import timedelta
 
@@ -43,12 +44,12 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     
     # Local apps that provide the AUTH_USER_MODEL must come first
     "apps.authentication", 
     
     # Third party apps
-    "drf_yasg",
     "corsheaders",
     "rest_framework",
     "rest_framework_simplejwt",
@@ -59,10 +60,21 @@ INSTALLED_APPS = [
     "apps.brands",
 ]
 
+# Swagger / ReDoc at /swagger/ and /redoc/ (config/docs.py). When off,
+# drf_yasg is not loaded at all.
+API_DOCS_ENABLED = os.environ.get('API_DOCS_ENABLED', 'True').lower() in ('true', '1', 'yes')
+# Prebuilt schema files (`manage.py generate_api_schema`), served instead of
+# generating the schema on the first request
+API_SCHEMA_ROOT = os.environ.get('API_SCHEMA_ROOT', os.path.join(BASE_DIR, 'openapi'))
+
+if API_DOCS_ENABLED:
+    INSTALLED_APPS.append("drf_yasg")
+
 MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
-    "whitenoise.middleware.WhiteNoiseMiddleware",
+    "utils.middleware.StaticFilesMiddleware",
+    "utils.replicas.ReplicaPinningMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -106,6 +118,74 @@ DATABASES = {
         "PASSWORD": os.environ.get("POSTGRES_PASSWORD"),
         "HOST": os.environ.get("POSTGRES_HOST"),
         "PORT": os.environ.get("POSTGRES_PORT"),
+        # Test connections before handing them out (a pool check on checkout
+        # when pooling, otherwise before reusing a persistent connection)
+        "CONN_HEALTH_CHECKS": os.environ.get("DB_CONN_HEALTH_CHECKS", "True").lower() in ("true", "1", "yes"),
+    }
+}
+
+# Connection pool (psycopg_pool), one per worker process. With gunicorn the
+# server can open up to WEB_CONCURRENCY * DB_POOL_MAX_SIZE connections.
+# Without pooling, connections persist for DB_CONN_MAX_AGE seconds instead.
+# Pool statistics are reported by /health/.
+if os.environ.get("DB_POOL", "True").lower() in ("true", "1", "yes"):
+    DATABASES["default"]["OPTIONS"] = {
+        "pool": {
+            "min_size": int(os.environ.get("DB_POOL_MIN_SIZE", "2")),
+            "max_size": int(os.environ.get("DB_POOL_MAX_SIZE", "10")),
+            # Seconds a request waits for a free connection before failing
+            "timeout": float(os.environ.get("DB_POOL_TIMEOUT", "10")),
+            # Idle connections above min_size are closed after this many seconds
+            "max_idle": float(os.environ.get("DB_POOL_MAX_IDLE", "300")),
+            # Connections are replaced after this many seconds
+            "max_lifetime": float(os.environ.get("DB_POOL_MAX_LIFETIME", "3600")),
+            "name": "default",
+        },
+    }
+else:
+    DATABASES["default"]["CONN_MAX_AGE"] = int(os.environ.get("DB_CONN_MAX_AGE", "60"))
+
+# Read replicas for catalog reads, e.g. POSTGRES_REPLICA_HOSTS="10.0.0.2,10.0.0.3:5433".
+# Each one becomes a "replica_<n>" alias with the primary's other settings.
+# utils.replicas.ReplicaRouter sends product and brand reads there; tests
+# mirror the replicas to the test primary, so they run on one local server.
+DATABASE_REPLICAS = []
+for index, address in enumerate(filter(None, os.environ.get("POSTGRES_REPLICA_HOSTS", "").split(",")), 1):
+    host, _, port = address.strip().partition(":")
+    alias = f"replica_{index}"
+    DATABASES[alias] = {
+        **DATABASES["default"],
+        "HOST": host,
+        "PORT": port or DATABASES["default"]["PORT"],
+        "TEST": {"MIRROR": "default"},
+    }
+    DATABASE_REPLICAS.append(alias)
+
+# `manage.py test` without replicas still gets a "replica_1" mirror for the
+# router tests (apps/products/tests.py); it is only routed to by tests that
+# list it in DATABASE_REPLICAS
+if not DATABASE_REPLICAS and sys.argv[1:2] == ["test"]:
+    DATABASES["replica_1"] = {**DATABASES["default"], "TEST": {"MIRROR": "default"}}
+
+DATABASE_ROUTERS = ["utils.replicas.ReplicaRouter"]
+
+# Seconds a replica may lag behind the primary: clients read the primary for
+# this long after a write, and cached responses are not stored while a cache
+# generation is younger than this
+REPLICA_LAG_WINDOW = int(os.environ.get("REPLICA_LAG_WINDOW", 5))
+
+
+# Cache
+# Local memory by default; set REDIS_URL so all workers share one cache
+# (required for cross-process invalidation in production).
+REDIS_URL = os.environ.get("REDIS_URL")
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": REDIS_URL,
+    } if REDIS_URL else {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
     }
 }
 
@@ -170,22 +250,30 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 # Django REST Framework
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'apps.authentication.authentication.ClaimsJWTAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'utils.renderers.ORJSONRenderer',
     ],
     'DEFAULT_PARSER_CLASSES': [
-        'rest_framework.parsers.JSONParser',
+        'utils.parsers.ORJSONParser',
     ],
     'EXCEPTION_HANDLER': 'utils.error_handler.custom_exception_handler',
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 20,
 }
 
+# Clients at or above this version get keyset (cursor) pagination on the
+# product listings by default; older clients keep page numbers.
+KEYSET_PAGINATION_MIN_CLIENT_VERSION = os.environ.get('KEYSET_PAGINATION_MIN_CLIENT_VERSION')
+
+# Route the read-only catalog views to their async counterparts
+# (apps/products/async_views.py). Needs the ASGI serve mode.
+ASYNC_CATALOG_VIEWS = os.environ.get('ASYNC_CATALOG_VIEWS', 'False').lower() in ('true', '1', 'yes')
+
 
 # Simple JWT Settings
 SIMPLE_JWT = {
@@ -193,7 +281,8 @@ SIMPLE_JWT = {
     'REFRESH_TOKEN_LIFETIME': timedelta(days=7),
     'ROTATE_REFRESH_TOKENS': True,
     'BLACKLIST_AFTER_ROTATION': True,
-    'UPDATE_LAST_LOGIN': True,
+    # last_login is written in batches by apps.authentication.logins
+    'UPDATE_LAST_LOGIN': False,
     
     'ALGORITHM': 'HS256',
     'SIGNING_KEY': SECRET_KEY,
@@ -221,7 +310,7 @@ SIMPLE_JWT = {
     'SLIDING_TOKEN_REFRESH_LIFETIME': timedelta(days=1),
     
     'TOKEN_OBTAIN_SERIALIZER': 'rest_framework_simplejwt.serializers.TokenObtainPairSerializer',
-    'TOKEN_REFRESH_SERIALIZER': 'rest_framework_simplejwt.serializers.TokenRefreshSerializer',
+    'TOKEN_REFRESH_SERIALIZER': 'apps.authentication.serializers.ClaimsTokenRefreshSerializer',
     'TOKEN_VERIFY_SERIALIZER': 'rest_framework_simplejwt.serializers.TokenVerifySerializer',
     'TOKEN_BLACKLIST_SERIALIZER': 'rest_framework_simplejwt.serializers.TokenBlacklistSerializer',
     'SLIDING_TOKEN_OBTAIN_SERIALIZER': 'rest_framework_simplejwt.serializers.TokenObtainSlidingSerializer',
@@ -17,28 +17,10 @@ Including another URLconf
 
 from django.conf import settings
 from django.contrib import admin
-from django.urls import path, include, re_path
+from django.urls import path, include
 from django.conf.urls.static import static
 
-from drf_yasg import openapi
-from drf_yasg.views import get_schema_view
-
 from .views import health_check
-from rest_framework import permissions
-
-
-schema_view = get_schema_view(
-   openapi.Info(
-      title="Surxon Mebel Platform API",
-      default_version='v1',
-      description="API documentation for Surxon Mebel Platform",
-      terms_of_service="www.google.com",
-      contact=openapi.Contact(email="contact@surxonmebel.com"),
-      license=openapi.License(name="MIT License"),
-   ),
-   public=True,
-   permission_classes=(permissions.AllowAny,),
-)
 
 
 urlpatterns = [
@@ -46,15 +28,14 @@ urlpatterns = [
     path("api/auth/", include('apps.authentication.urls')),
     path("api/products/", include('apps.products.urls')),
 
-    # path("api/brands/", include('apps.brands.urls')),
+    path("api/brands/", include('apps.brands.urls')),
     path("health/", health_check, name="health_check"),
-
-    # Swagger and Redoc documentation URLs
-    re_path(r'^swagger(?P<format>\.json|\.yaml)$', schema_view.without_ui(cache_timeout=0), name='schema-json'),
-    re_path(r'^swagger/$', schema_view.with_ui('swagger', cache_timeout=0), name='schema-swagger-ui'),
-    re_path(r'^redoc/$', schema_view.with_ui('redoc', cache_timeout=0), name='schema-redoc'),
 ]
 
+# Swagger and Redoc documentation URLs
+if settings.API_DOCS_ENABLED:
+    urlpatterns += [path("", include("config.docs"))]
+
 # Serve static and media files in development and production
 if settings.DEBUG or True:  # Always serve for Railway deployment
     urlpatterns += static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
@@ -3,13 +3,15 @@ from django.views.decorators.http import require_http_methods
 from django.conf import settings
 import os
 
+from utils.db import get_pool_stats
+
 @require_http_methods(["GET"])
 def health_check(request):
     """Health check endpoint for Railway deployment"""
     static_files_exist = os.path.exists(settings.STATIC_ROOT)
     media_files_exist = os.path.exists(settings.MEDIA_ROOT)
     
-    return JsonResponse({
+    data = {
         'status': 'healthy',
         'static_root': settings.STATIC_ROOT,
         'static_url': settings.STATIC_URL,
@@ -18,4 +20,8 @@ def health_check(request):
         'static_files_exist': static_files_exist,
         'media_files_exist': media_files_exist,
         'debug': settings.DEBUG,
-    })
\ No newline at end of file
+    }
+    if settings.DEBUG or request.user.is_staff:
+        # Per worker process; None when connections are not pooled
+        data['database_pool'] = get_pool_stats()
+    return JsonResponse(data)
\ No newline at end of file
@@ -1,7 +1,8 @@
 from .validate_phone_number import validate_uzbekistan_phone
+from .validate_color_codes import validate_hex_color_codes
 from .abstract_model import AbstractBaseModel
 from .response_format import APIResponse
 from .error_handler import custom_exception_handler, GlobalErrorHandlingMiddleware
 from .pagination import CustomPageNumberPagination
 
-__all__ = ["validate_uzbekistan_phone", "AbstractBaseModel"]
\ No newline at end of file
+__all__ = ["validate_uzbekistan_phone", "validate_hex_color_codes", "AbstractBaseModel"]
\ No newline at end of file
@@ -0,0 +1,198 @@
+import datetime
+import hashlib
+import time
+import uuid
+
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils.http import parse_http_date
+
+from .conditional import not_modified_response
+from .replicas import lag_window
+
+
+def _version_key(name):
+    return f"cache-version:{name}"
+
+
+def _new_version():
+    # Prefixed with the creation time, see `versions_settled()`
+    return f"{int(time.time())}-{uuid.uuid4().hex}"
+
+
+def versions_settled(versions, window):
+    """
+    Return whether every version token in ``versions`` was created at least
+    ``window`` seconds ago.
+    """
+    if not window:
+        return True
+    now = time.time()
+    for version in versions.values():
+        created, _, _ = version.partition("-")
+        if created.isdigit() and now - int(created) < window:
+            return False
+    return True
+
+
+def get_cache_version(name):
+    """
+    Return the current version token for a named group of cache entries.
+
+    Entries are stored under keys that embed this token, so bumping it
+    invalidates the whole group in O(1) without scanning keys. Tokens are
+    random rather than counters so that an evicted version key can never
+    resurrect stale entries.
+    """
+    return get_cache_versions([name])[name]
+
+
+def get_cache_versions(names):
+    """
+    Return ``{name: token}`` for several version names in one cache read.
+    """
+    versions = cache.get_many([_version_key(name) for name in names])
+    tokens = {}
+    for name in names:
+        key = _version_key(name)
+        version = versions.get(key)
+        if version is None:
+            version = _new_version()
+            if not cache.add(key, version, timeout=None):
+                version = cache.get(key, version)
+        tokens[name] = version
+    return tokens
+
+
+async def aget_cache_version(name):
+    return (await aget_cache_versions([name]))[name]
+
+
+async def aget_cache_versions(names):
+    """
+    Async `get_cache_versions()`.
+    """
+    versions = await cache.aget_many([_version_key(name) for name in names])
+    tokens = {}
+    for name in names:
+        key = _version_key(name)
+        version = versions.get(key)
+        if version is None:
+            version = _new_version()
+            if not await cache.aadd(key, version, timeout=None):
+                version = await cache.aget(key, version)
+        tokens[name] = version
+    return tokens
+
+
+def bump_cache_version(name):
+    """
+    Invalidate every cache entry keyed on the named version.
+    """
+    bump_cache_versions([name])
+
+
+def bump_cache_versions(names):
+    cache.set_many({_version_key(name): _new_version() for name in names}, timeout=None)
+
+
+class BaseCachedResponseMixin:
+    """
+    Caches the rendered response of anonymous GET requests.
+
+    Keys combine the view, scheme and host, URL kwargs, the normalized
+    query string, the negotiated media type, the `cache_vary_headers` values
+    and the tokens of the versions returned by `get_cache_generations()`.
+    Bumping any of those
+    versions makes the old entries unreachable, so no keys are scanned.
+
+    The cached ETag is reused, so `If-None-Match` on a hit gets a 304
+    without touching the database. Responses are not stored while one of the
+    versions is younger than the replica lag window, since they may have been
+    read from a replica that has not caught up with the bump yet.
+    """
+    cache_timeout = 60 * 10
+    cache_vary_headers = ()
+    cache_key_prefix = "response"
+
+    def get_cache_generations(self):
+        """Return the version names whose bump invalidates this response."""
+        raise NotImplementedError
+
+    def get_response_cache_key(self, request, versions):
+        query = sorted(request.query_params.lists())
+        fingerprint = repr((
+            # Paginated bodies embed absolute next/previous links
+            request.scheme,
+            request.get_host(),
+            sorted(self.kwargs.items()),
+            query,
+            request.accepted_media_type,
+            [request.headers.get(header) for header in self.cache_vary_headers],
+            [versions[name] for name in sorted(versions)],
+        ))
+        digest = hashlib.sha256(fingerprint.encode()).hexdigest()
+        return f"{self.cache_key_prefix}:{type(self).__name__}:{digest}"
+
+    def cached_response(self, request, cached):
+        """Build the response (or a 304) for a cache hit."""
+        headers = cached["headers"]
+        last_modified = None
+        if "Last-Modified" in headers:
+            last_modified = datetime.datetime.fromtimestamp(
+                parse_http_date(headers["Last-Modified"]), tz=datetime.timezone.utc
+            )
+        not_modified = not_modified_response(
+            request, etag=headers.get("ETag"), last_modified=last_modified
+        )
+        if not_modified is not None:
+            return not_modified
+        response = HttpResponse(cached["content"], content_type=cached["content_type"])
+        for header, value in headers.items():
+            response[header] = value
+        return response
+
+    def store_on_render(self, key, versions, response):
+        if response.status_code == 200 and versions_settled(versions, lag_window()):
+            response.add_post_render_callback(lambda rendered: self._store(key, rendered))
+        return response
+
+    def _store(self, key, response):
+        headers = {
+            header: response[header]
+            for header in ("ETag", "Last-Modified")
+            if response.has_header(header)
+        }
+        cache.set(key, {
+            "content": response.content,
+            "content_type": response["Content-Type"],
+            "headers": headers,
+        }, self.cache_timeout)
+
+
+class CachedResponseMixin(BaseCachedResponseMixin):
+    def get(self, request, *args, **kwargs):
+        if request.user.is_authenticated:
+            return super().get(request, *args, **kwargs)
+
+        versions = get_cache_versions(self.get_cache_generations())
+        key = self.get_response_cache_key(request, versions)
+        cached = cache.get(key)
+        if cached is not None:
+            return self.cached_response(request, cached)
+        return self.store_on_render(key, versions, super().get(request, *args, **kwargs))
+
+
+class AsyncCachedResponseMixin(BaseCachedResponseMixin):
+    """`CachedResponseMixin` for async views."""
+
+    async def get(self, request, *args, **kwargs):
+        if request.user.is_authenticated:
+            return await super().get(request, *args, **kwargs)
+
+        versions = await aget_cache_versions(self.get_cache_generations())
+        key = self.get_response_cache_key(request, versions)
+        cached = await cache.aget(key)
+        if cached is not None:
+            return self.cached_response(request, cached)
+        return self.store_on_render(key, versions, await super().get(request, *args, **kwargs))
@@ -0,0 +1,231 @@
+import hashlib
+import json
+
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Count, Max
+from django.http import Http404
+from django.utils.cache import get_conditional_response, quote_etag
+from django.utils.http import http_date
+
+
+def make_etag(data, weak=False):
+    """
+    Build an ETag from the JSON representation of ``data``.
+
+    Strong ETags are meant for hashes of the response payload itself; use
+    ``weak=True`` when hashing a fingerprint of the underlying rows.
+    """
+    payload = json.dumps(data, cls=DjangoJSONEncoder, sort_keys=True, separators=(",", ":"))
+    etag = quote_etag(hashlib.sha256(payload.encode()).hexdigest()[:32])
+    return f"W/{etag}" if weak else etag
+
+
+def not_modified_response(request, etag=None, last_modified=None):
+    """
+    Return a 304 (or 412) response when the request's conditional headers
+    match ``etag`` / ``last_modified``, otherwise None.
+
+    Args:
+        request: Incoming request
+        etag: Quoted ETag of the current representation
+        last_modified: Aware datetime of the last change
+    """
+    timestamp = int(last_modified.timestamp()) if last_modified else None
+    response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+    if response is not None and etag:
+        response["ETag"] = etag
+    return response
+
+
+class BaseConditionalRetrieveMixin:
+    """
+    Answers `If-None-Match` / `If-Modified-Since` for a single object from a
+    ``values()`` probe of its timestamps, before the object is fetched and
+    serialized.
+
+    `conditional_fields` lists the timestamps that affect the representation
+    (e.g. the related category's `updated_at` when its name is embedded).
+    """
+    conditional_fields = ("updated_at",)
+
+    def get_conditional_stamps(self):
+        """Return the queryset of the object's `conditional_fields`."""
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        lookup = {self.lookup_field: self.kwargs[lookup_url_kwarg]}
+        return (
+            self.filter_queryset(self.get_queryset())
+            .filter(**lookup)
+            .values_list(*self.conditional_fields)
+        )
+
+    def build_conditional_state(self, stamps):
+        """Return ``(etag, last_modified)`` from the probed timestamps."""
+        if stamps is None:
+            raise Http404
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        last_modified = max(stamp for stamp in stamps if stamp is not None)
+        etag = make_etag([str(self.kwargs[lookup_url_kwarg]), *stamps], weak=True)
+        return etag, last_modified
+
+    @staticmethod
+    def set_conditional_headers(response, etag, last_modified):
+        if response.status_code == 200:
+            response["ETag"] = etag
+            response["Last-Modified"] = http_date(last_modified.timestamp())
+        return response
+
+
+class ConditionalRetrieveMixin(BaseConditionalRetrieveMixin):
+    def get(self, request, *args, **kwargs):
+        etag, last_modified = self.get_conditional_state()
+        not_modified = not_modified_response(request, etag=etag, last_modified=last_modified)
+        if not_modified is not None:
+            return not_modified
+
+        response = super().get(request, *args, **kwargs)
+        return self.set_conditional_headers(response, etag, last_modified)
+
+    def get_conditional_state(self):
+        return self.build_conditional_state(self.get_conditional_stamps().first())
+
+
+class AsyncConditionalRetrieveMixin(BaseConditionalRetrieveMixin):
+    """`ConditionalRetrieveMixin` for async views."""
+
+    async def get(self, request, *args, **kwargs):
+        etag, last_modified = self.build_conditional_state(
+            await self.get_conditional_stamps().afirst()
+        )
+        not_modified = not_modified_response(request, etag=etag, last_modified=last_modified)
+        if not_modified is not None:
+            return not_modified
+
+        response = await super().get(request, *args, **kwargs)
+        return self.set_conditional_headers(response, etag, last_modified)
+
+
+class BaseConditionalListMixin:
+    """
+    Answers `If-None-Match` for a list from one aggregate query: the latest
+    `updated_at` of each `conditional_fields` entry plus the row count (which
+    also catches deletions), combined with the full request path.
+
+    Only an ETag is sent; `Last-Modified` alone cannot detect deleted rows.
+
+    The aggregate scans every filtered row, so views whose changes all bump
+    cache versions (see `utils.cache`) return their names from
+    `get_conditional_generations()` and the fingerprint is cached under
+    those versions; `fingerprint_ignored_params` lists the query parameters
+    (pagination) that do not change it.
+    """
+    conditional_fields = ("updated_at",)
+    conditional_headers = ()
+    fingerprint_ignored_params = ()
+    fingerprint_cache_timeout = 60 * 10
+
+    def get_conditional_queryset(self):
+        return self.filter_queryset(self.get_queryset())
+
+    def get_conditional_generations(self):
+        """Return the version names covering the fingerprint, or None."""
+        return None
+
+    def get_fingerprint_cache_key(self, versions):
+        query = sorted(
+            (param, values) for param, values in self.request.query_params.lists()
+            if param not in self.fingerprint_ignored_params
+        )
+        fingerprint = repr((
+            sorted(self.kwargs.items()),
+            query,
+            [versions[name] for name in sorted(versions)],
+        ))
+        digest = hashlib.sha256(fingerprint.encode()).hexdigest()
+        return f"list-fingerprint:{type(self).__name__}:{digest}"
+
+    def get_conditional_aggregates(self):
+        return {
+            "count": Count("pk"),
+            **{f"max_{index}": Max(field) for index, field in enumerate(self.conditional_fields)},
+        }
+
+    def build_conditional_etag(self, fingerprint):
+        return make_etag([
+            self.request.get_full_path(),
+            [self.request.headers.get(header) for header in self.conditional_headers],
+            fingerprint,
+        ], weak=True)
+
+
+class ConditionalListMixin(BaseConditionalListMixin):
+    def get(self, request, *args, **kwargs):
+        etag = self.get_conditional_etag()
+        not_modified = not_modified_response(request, etag=etag)
+        if not_modified is not None:
+            return not_modified
+
+        response = super().get(request, *args, **kwargs)
+        if response.status_code == 200:
+            response["ETag"] = etag
+        return response
+
+    def get_conditional_etag(self):
+        from .cache import get_cache_versions, versions_settled
+        from .replicas import lag_window
+
+        generations = self.get_conditional_generations()
+        if generations is None:
+            return self.build_conditional_etag(self._aggregate_fingerprint())
+
+        versions = get_cache_versions(generations)
+        key = self.get_fingerprint_cache_key(versions)
+        fingerprint = cache.get(key)
+        if fingerprint is None:
+            fingerprint = self._aggregate_fingerprint()
+            # Not while a replica may still be behind the bump
+            if versions_settled(versions, lag_window()):
+                cache.set(key, fingerprint, self.fingerprint_cache_timeout)
+        return self.build_conditional_etag(fingerprint)
+
+    def _aggregate_fingerprint(self):
+        return self.get_conditional_queryset().order_by().aggregate(
+            **self.get_conditional_aggregates()
+        )
+
+
+class AsyncConditionalListMixin(BaseConditionalListMixin):
+    """`ConditionalListMixin` for async views."""
+
+    async def get(self, request, *args, **kwargs):
+        etag = await self.aget_conditional_etag()
+        not_modified = not_modified_response(request, etag=etag)
+        if not_modified is not None:
+            return not_modified
+
+        response = await super().get(request, *args, **kwargs)
+        if response.status_code == 200:
+            response["ETag"] = etag
+        return response
+
+    async def aget_conditional_etag(self):
+        from .cache import aget_cache_versions, versions_settled
+        from .replicas import lag_window
+
+        generations = self.get_conditional_generations()
+        if generations is None:
+            return self.build_conditional_etag(await self._aaggregate_fingerprint())
+
+        versions = await aget_cache_versions(generations)
+        key = self.get_fingerprint_cache_key(versions)
+        fingerprint = await cache.aget(key)
+        if fingerprint is None:
+            fingerprint = await self._aaggregate_fingerprint()
+            if versions_settled(versions, lag_window()):
+                await cache.aset(key, fingerprint, self.fingerprint_cache_timeout)
+        return self.build_conditional_etag(fingerprint)
+
+    async def _aaggregate_fingerprint(self):
+        return await self.get_conditional_queryset().order_by().aaggregate(
+            **self.get_conditional_aggregates()
+        )
@@ -0,0 +1,31 @@
+from django.db import DEFAULT_DB_ALIAS, connections
+
+
+def get_pool_stats(alias=DEFAULT_DB_ALIAS):
+    """
+    Return statistics of this process's connection pool for ``alias``, or
+    None when the database is not pooled.
+
+    ``checkout_wait_ms`` is the mean time a request waited for a connection
+    since the pool was opened.
+    """
+    pool = getattr(connections[alias], "pool", None)
+    if pool is None:
+        return None
+
+    # psycopg_pool omits counters that are still zero
+    stats = pool.get_stats()
+    checkouts = stats.get("requests_num", 0)
+    return {
+        "min_size": stats.get("pool_min", 0),
+        "max_size": stats.get("pool_max", 0),
+        "size": stats.get("pool_size", 0),
+        "in_use": stats.get("pool_size", 0) - stats.get("pool_available", 0),
+        "idle": stats.get("pool_available", 0),
+        "waiting": stats.get("requests_waiting", 0),
+        "checkouts": checkouts,
+        "checkout_wait_ms": round(stats.get("requests_wait_ms", 0) / checkouts, 3) if checkouts else 0.0,
+        "checkout_errors": stats.get("requests_errors", 0),
+        "connection_errors": stats.get("connections_errors", 0),
+        "connections_lost": stats.get("connections_lost", 0),
+    }
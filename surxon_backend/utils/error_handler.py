@@ -5,6 +5,7 @@ from rest_framework import status
 from django.core.exceptions import ValidationError
 from django.db import IntegrityError
 from django.http import Http404
+from django.utils.deprecation import MiddlewareMixin
 from rest_framework.exceptions import (
     NotFound, ValidationError as DRFValidationError,
     PermissionDenied, AuthenticationFailed, MethodNotAllowed
@@ -80,18 +81,11 @@ def custom_exception_handler(exc, context):
     return None
 
 
-class GlobalErrorHandlingMiddleware:
+class GlobalErrorHandlingMiddleware(MiddlewareMixin):
     """
     Middleware to catch any unhandled exceptions and return unified error responses
     """
     
-    def __init__(self, get_response):
-        self.get_response = get_response
-    
-    def __call__(self, request):
-        response = self.get_response(request)
-        return response
-    
     def process_exception(self, request, exception):
         """
         Handle exceptions that weren't caught by the view layer
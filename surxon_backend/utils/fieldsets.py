@@ -0,0 +1,74 @@
+from rest_framework.exceptions import ValidationError
+
+
+class SparseFieldsetMixin:
+    """
+    Serializer mixin for sparse fieldsets: `?fields=a,b` keeps only the
+    listed fields and `?exclude=a,b` drops them. Unknown names are a 400.
+
+    `field_columns` maps output fields to the model columns they read (a
+    field reads the column of the same name by default), so views can pass
+    `get_columns()` to `.only()` / `.values()` and never read the others.
+    """
+    fields_query_param = "fields"
+    exclude_query_param = "exclude"
+    field_columns = {}
+    # Columns read whatever fields are selected
+    required_columns = ("id",)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        selected = self.get_sparse_fields(self.context.get("request"))
+        if selected is not None:
+            for name in set(self.fields) - set(selected):
+                self.fields.pop(name)
+
+    @classmethod
+    def get_sparse_fields(cls, request):
+        """
+        Return the selected field names in declaration order, or None when
+        the request does not ask for a sparse fieldset.
+        """
+        if request is None:
+            return None
+        params = request.query_params
+        requested = {
+            param: _split(params[param])
+            for param in (cls.fields_query_param, cls.exclude_query_param)
+            if param in params
+        }
+        if not requested:
+            return None
+
+        allowed = cls.Meta.fields
+        errors = {}
+        for param, names in requested.items():
+            unknown = [name for name in names if name not in allowed]
+            if unknown:
+                errors[param] = (
+                    f"Unknown field(s): {', '.join(unknown)}. "
+                    f"Allowed fields: {', '.join(allowed)}."
+                )
+            elif not names:
+                errors[param] = "Must be a comma-separated list of field names."
+        if errors:
+            raise ValidationError(errors)
+
+        selected = requested.get(cls.fields_query_param, allowed)
+        excluded = requested.get(cls.exclude_query_param, ())
+        return [name for name in allowed if name in selected and name not in excluded]
+
+    @classmethod
+    def get_columns(cls, request=None):
+        """
+        Return the model columns needed to render the selected fields.
+        """
+        fields = cls.get_sparse_fields(request) or cls.Meta.fields
+        columns = dict.fromkeys(cls.required_columns)
+        for name in fields:
+            columns.update(dict.fromkeys(cls.field_columns.get(name, (name,))))
+        return list(columns)
+
+
+def _split(value):
+    return [item.strip() for item in value.split(",") if item.strip()]
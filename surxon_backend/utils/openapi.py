@@ -0,0 +1,23 @@
+"""
+drf_yasg's `openapi` and `swagger_auto_schema` for annotating views.
+
+With `API_DOCS_ENABLED` off, drf_yasg is never imported: the decorator
+returns the view unchanged and `openapi` accepts the same calls.
+"""
+from django.conf import settings
+
+if settings.API_DOCS_ENABLED:
+    from drf_yasg import openapi
+    from drf_yasg.utils import swagger_auto_schema
+else:
+    class _OpenAPIStub:
+        def __getattr__(self, name):
+            # Constants such as TYPE_OBJECT, and classes such as Schema
+            if name.isupper():
+                return name.lower()
+            return lambda *args, **kwargs: None
+
+    openapi = _OpenAPIStub()
+
+    def swagger_auto_schema(*args, **kwargs):
+        return lambda view_method: view_method
@@ -1,4 +1,16 @@
-from rest_framework.pagination import PageNumberPagination
+import contextlib
+import datetime
+from collections.abc import Mapping
+from functools import partial
+
+from django.conf import settings
+from django.core import signing
+from django.db.models import Q
+from packaging.version import InvalidVersion, Version
+from django.core.paginator import InvalidPage
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 from utils.response_format import APIResponse
 
 
@@ -9,7 +21,7 @@ class CustomPageNumberPagination(PageNumberPagination):
     page_size = 20
     page_size_query_param = 'page_size'
     max_page_size = 100
-    
+
     def get_paginated_response(self, data):
         """
         Return a paginated response using the unified response format
@@ -20,4 +32,265 @@ class CustomPageNumberPagination(PageNumberPagination):
             next_url=self.get_next_link(),
             previous_url=self.get_previous_link(),
             message="Products retrieved successfully"
-        )
\ No newline at end of file
+        )
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """
+        Async `paginate_queryset()`: the count and the page are fetched with
+        the async ORM.
+        """
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        paginator = self.django_paginator_class(queryset, page_size)
+        paginator.count = await queryset.acount()
+        page_number = self.get_page_number(request, paginator)
+        try:
+            self.page = paginator.page(page_number)
+        except InvalidPage as exc:
+            raise NotFound(self.invalid_page_message.format(
+                page_number=page_number, message=str(exc)
+            ))
+        self.page.object_list = [row async for row in self.page.object_list]
+
+        if paginator.num_pages > 1 and self.template is not None:
+            self.display_page_controls = True
+        self.request = request
+        return list(self.page)
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset (cursor) pagination that continues from the last row of the
+    previous page instead of using OFFSET, so every page costs the same.
+
+    Rows are ordered by the queryset ordering (``-created_at`` by default) with
+    the primary key appended as a tie-breaker. The cursor is an opaque signed
+    token holding that ordering and the boundary row's values. No COUNT(*) is
+    run, so ``count`` in the response is null.
+    """
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    cursor_query_param = 'cursor'
+    mode_query_param = 'pagination'
+    client_version_header = 'X-Client-Version'
+    ordering = ('-created_at',)
+    invalid_cursor_message = 'Invalid cursor'
+    salt = 'utils.pagination.KeysetPagination'
+
+    @classmethod
+    def is_requested(cls, request):
+        """
+        Keyset mode is opt-in: a cursor, ``?pagination=cursor`` or a client
+        version at least ``KEYSET_PAGINATION_MIN_CLIENT_VERSION``.
+        """
+        params = request.query_params
+        if cls.cursor_query_param in params or params.get(cls.mode_query_param) == 'cursor':
+            return True
+
+        min_version = getattr(settings, 'KEYSET_PAGINATION_MIN_CLIENT_VERSION', None)
+        client_version = request.headers.get(cls.client_version_header)
+        if not min_version or not client_version:
+            return False
+        try:
+            return Version(client_version) >= Version(min_version)
+        except InvalidVersion:
+            return False
+
+    def paginate_queryset(self, queryset, request, view=None):
+        queryset, position, reverse = self._page_queryset(queryset, request)
+        return self._set_page(list(queryset), position, reverse)
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        queryset, position, reverse = self._page_queryset(queryset, request)
+        return self._set_page([row async for row in queryset], position, reverse)
+
+    def _page_queryset(self, queryset, request):
+        """
+        Return ``(queryset, position, reverse)`` where the queryset fetches
+        the requested page plus one row to detect further pages.
+        """
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.fields = self.get_ordering(queryset)
+
+        position, reverse = self.decode_cursor(request)
+        fields = [(name, descending != reverse) for name, descending in self.fields]
+        queryset = queryset.order_by(*(f"-{name}" if desc else name for name, desc in fields))
+        if position is not None:
+            queryset = queryset.filter(self._after(fields, position))
+        return queryset[:self.page_size + 1], position, reverse
+
+    def _set_page(self, rows, position, reverse):
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+
+        if reverse:
+            rows.reverse()
+            self.has_next, self.has_previous = position is not None, has_more
+        else:
+            self.has_next, self.has_previous = has_more, position is not None
+        self.page = rows
+        return rows
+
+    def get_paginated_response(self, data):
+        return APIResponse.paginated_success(
+            data=data,
+            count=None,
+            next_url=self.get_next_link(),
+            previous_url=self.get_previous_link(),
+            message="Products retrieved successfully"
+        )
+
+    def get_page_size(self, request):
+        with contextlib.suppress(KeyError, ValueError):
+            page_size = int(request.query_params[self.page_size_query_param])
+            if page_size > 0:
+                return min(page_size, self.max_page_size)
+        return self.page_size
+
+    def get_ordering(self, queryset):
+        """
+        Return ``[(field, descending), ...]`` from the queryset ordering with
+        the primary key appended so that the ordering is total.
+        """
+        ordering = [str(field) for field in (queryset.query.order_by or self.ordering)]
+        fields = [(field.lstrip('-'), field.startswith('-')) for field in ordering]
+        pk_name = queryset.model._meta.pk.name
+        if fields[-1][0] not in ('pk', pk_name):
+            fields.append((pk_name, fields[-1][1]))
+        return fields
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self._cursor_link(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        return self._cursor_link(self.page[0], reverse=True)
+
+    def decode_cursor(self, request):
+        """
+        Return ``(position, reverse)`` for the requested cursor, or
+        ``(None, False)`` for the first page.
+        """
+        token = request.query_params.get(self.cursor_query_param)
+        if not token:
+            return None, False
+        try:
+            cursor = signing.loads(token, salt=self.salt)
+        except signing.BadSignature:
+            raise NotFound(self.invalid_cursor_message)
+
+        ordering = [[name, descending] for name, descending in self.fields]
+        if cursor.get('o') != ordering or len(cursor.get('v', ())) != len(ordering):
+            raise NotFound(self.invalid_cursor_message)
+        return cursor['v'], bool(cursor.get('r'))
+
+    def encode_cursor(self, position, reverse):
+        cursor = {
+            'o': [[name, descending] for name, descending in self.fields],
+            'v': position,
+            'r': reverse,
+        }
+        return signing.dumps(cursor, salt=self.salt, compress=True)
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                'name': self.cursor_query_param,
+                'required': False,
+                'in': 'query',
+                'description': 'The pagination cursor value.',
+                'schema': {'type': 'string'},
+            },
+            {
+                'name': self.page_size_query_param,
+                'required': False,
+                'in': 'query',
+                'description': 'Number of results to return per page.',
+                'schema': {'type': 'integer'},
+            },
+        ]
+
+    def _cursor_link(self, row, reverse):
+        # Rows are model instances or `values()` dicts
+        get = row.__getitem__ if isinstance(row, Mapping) else partial(getattr, row)
+        position = [_cursor_value(get(name)) for name, _ in self.fields]
+        url = self.request.build_absolute_uri()
+        url = remove_query_param(url, self.mode_query_param)
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(position, reverse))
+
+    @staticmethod
+    def _after(fields, position):
+        """
+        Build the row-value comparison ``(f1, f2, ...) > (v1, v2, ...)`` for
+        the given ordering as an OR of equality prefixes.
+
+        The leading field is also bounded on its own so the planner can turn
+        the whole condition into a single index range scan.
+        """
+        first_name, first_desc = fields[0]
+        bound = Q(**{f"{first_name}__{'lte' if first_desc else 'gte'}": position[0]})
+
+        condition = Q()
+        for index, (name, descending) in enumerate(fields):
+            clause = Q(**{f"{name}__{'lt' if descending else 'gt'}": position[index]})
+            for (prev_name, _), value in zip(fields[:index], position):
+                clause &= Q(**{prev_name: value})
+            condition |= clause
+        return bound & condition
+
+
+class CatalogPagination(CustomPageNumberPagination):
+    """
+    Page-number pagination with an opt-in keyset (cursor) mode.
+
+    Clients that send a ``cursor``, ``?pagination=cursor`` or a recent enough
+    ``X-Client-Version`` get ``KeysetPagination``; everyone else keeps the
+    existing page-number behaviour.
+    """
+    keyset_class = KeysetPagination
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = None
+        if self.keyset_class.is_requested(request):
+            self.keyset = self.keyset_class()
+            return self.keyset.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        self.keyset = None
+        if self.keyset_class.is_requested(request):
+            self.keyset = self.keyset_class()
+            return await self.keyset.apaginate_queryset(queryset, request, view)
+        return await super().apaginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.keyset is not None:
+            return self.keyset.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+    def get_schema_operation_parameters(self, view):
+        parameters = super().get_schema_operation_parameters(view)
+        parameters.append({
+            'name': self.keyset_class.cursor_query_param,
+            'required': False,
+            'in': 'query',
+            'description': 'Keyset pagination cursor. Use `pagination=cursor` to start.',
+            'schema': {'type': 'string'},
+        })
+        return parameters
+
+
+def _cursor_value(value):
+    """Convert a column value to a JSON-safe value that round-trips in lookups."""
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return str(value)
@@ -0,0 +1,43 @@
+import orjson
+from rest_framework.renderers import JSONRenderer
+
+# JSONRenderer escapes these so the output is also valid JavaScript
+LINE_SEPARATOR = "\u2028".encode()
+PARAGRAPH_SEPARATOR = "\u2029".encode()
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    Drop-in `JSONRenderer` that encodes with orjson.
+
+    The output is byte-for-byte the same as `JSONRenderer` for API payloads:
+    datetimes, dates, times, Decimals and other non-JSON types go through
+    DRF's `JSONEncoder.default`, and U+2028/U+2029 are escaped. Indented
+    output (`; indent=` in Accept, the browsable API), `UNICODE_JSON=False`,
+    `COMPACT_JSON=False` and values orjson rejects (such as integers over
+    64 bits) fall back to the standard library encoder.
+
+    Floats are written in orjson's notation, which only differs from
+    Python's for magnitudes below 1e-4 or from 1e16 up (``1e-05`` vs
+    ``0.00001``), and NaN/Infinity are written as null instead of failing.
+    """
+    options = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        if indent is not None or self.ensure_ascii or not self.compact:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(data, default=self.encoder_class().default, option=self.options)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        if LINE_SEPARATOR in ret:
+            ret = ret.replace(LINE_SEPARATOR, b'\\u2028')
+        if PARAGRAPH_SEPARATOR in ret:
+            ret = ret.replace(PARAGRAPH_SEPARATOR, b'\\u2029')
+        return ret
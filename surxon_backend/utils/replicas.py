@@ -0,0 +1,103 @@
+import random
+import time
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.utils.deprecation import MiddlewareMixin
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+# Set while the current request (or task, or thread) must read from the
+# primary: it is not a safe request, it has written, or the client wrote
+# within the read-your-writes window
+_pinned = ContextVar("db_pinned_to_primary", default=False)
+_wrote = ContextVar("db_wrote", default=False)
+
+
+def replica_aliases():
+    return settings.DATABASE_REPLICAS
+
+
+def lag_window():
+    """
+    Seconds a replica may lag behind the primary, or 0 without replicas.
+    """
+    return settings.REPLICA_LAG_WINDOW if replica_aliases() else 0
+
+
+class ReplicaRouter:
+    """
+    Sends reads of the catalog apps (`replica_apps`) to a random replica in
+    `DATABASE_REPLICAS`; everything else, and all writes, go to the primary.
+
+    Reads go to the primary instead once the current context is pinned (see
+    `ReplicaPinningMiddleware`), after it has written through the ORM, and
+    inside a transaction on the primary.
+    """
+    replica_apps = {"products", "brands"}
+
+    def db_for_read(self, model, **hints):
+        replicas = replica_aliases()
+        if (
+            not replicas
+            or model._meta.app_label not in self.replica_apps
+            or _pinned.get()
+            or connections[DEFAULT_DB_ALIAS].in_atomic_block
+        ):
+            return DEFAULT_DB_ALIAS
+
+        # Related objects are read from the database their instance came from
+        instance = hints.get("instance")
+        if instance is not None and instance._state.db in replicas:
+            return instance._state.db
+        return random.choice(replicas)
+
+    def db_for_write(self, model, **hints):
+        _pinned.set(True)
+        _wrote.set(True)
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {DEFAULT_DB_ALIAS, *replica_aliases()}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Replicas receive the schema through replication
+        return db not in replica_aliases()
+
+
+class ReplicaPinningMiddleware(MiddlewareMixin):
+    """
+    Pins requests to the primary database for the `ReplicaRouter`.
+
+    Unsafe requests are pinned from the start and safe ones as soon as they
+    write. After a write the client gets a cookie that pins its requests for
+    `REPLICA_LAG_WINDOW` seconds, so it reads its own writes even from a
+    different worker while the replicas catch up.
+    """
+    cookie_name = "db_primary_until"
+
+    def process_request(self, request):
+        pinned = request.method not in SAFE_METHODS
+        if not pinned and self.cookie_name in request.COOKIES:
+            try:
+                pinned = float(request.COOKIES[self.cookie_name]) > time.time()
+            except ValueError:
+                pass
+        _pinned.set(pinned)
+        _wrote.set(False)
+
+    def process_response(self, request, response):
+        window = lag_window()
+        if window and _wrote.get():
+            response.set_cookie(
+                self.cookie_name, f"{time.time() + window:.3f}", max_age=window,
+                httponly=True, samesite="Lax",
+            )
+        # Worker threads are reused, don't leak the state into the next job
+        _pinned.set(False)
+        _wrote.set(False)
+        return response
@@ -49,14 +49,14 @@ class APIResponse:
         return Response(response_data, status=status_code)
     
     @staticmethod
-    def paginated_success(data: Any, count: int, next_url: Optional[str] = None, 
+    def paginated_success(data: Any, count: Optional[int], next_url: Optional[str] = None, 
                          previous_url: Optional[str] = None, message: str = "Success") -> Response:
         """
         Create a paginated successful response
         
         Args:
             data: Response data
-            count: Total count of items
+            count: Total count of items (None when it is not computed)
             next_url: URL for next page
             previous_url: URL for previous page
             message: Success message
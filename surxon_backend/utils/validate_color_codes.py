@@ -0,0 +1,23 @@
+import re
+
+from django.core.exceptions import ValidationError
+
+HEX_COLOR_RE = re.compile(r"^#[0-9A-Fa-f]{6}$")
+
+
+def validate_hex_color_codes(value):
+    """
+    Validate a list of HEX color codes
+    Expected format: ['#RRGGBB', ...] (e.g., ['#FF0000', '#00FF00'])
+    """
+    if not value:
+        return
+
+    if not isinstance(value, list):
+        raise ValidationError('Color codes must be a list of HEX color codes.')
+
+    for color in value:
+        if not isinstance(color, str) or not HEX_COLOR_RE.fullmatch(color):
+            raise ValidationError(
+                f"Invalid HEX color code: {color}. Use format #RRGGBB (e.g., #FF0000)"
+            )